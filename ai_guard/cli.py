@@ -1,6 +1,9 @@
 """Command-line interface for ai-guard."""
 
 import argparse
+import fnmatch
+import functools
+import os
 import re
 import sys
 from pathlib import Path
@@ -8,9 +11,11 @@ from typing import Optional
 
 from ai_guard.core import GuardFile
 
-# Pre-compiled regex for parse_target() — matches known file extensions followed by colon
+# Pre-compiled regex for parse_target() — splits at the first known file
+# extension followed by a colon, capturing (path, identifier)
 _TARGET_EXT_RE = re.compile(
-    r"(\.(?:py|pyw|js|jsx|ts|tsx|cpp|c|h|hpp|cc|cxx|hxx|rs)):"
+    r"(.*?\.(?:py|pyw|js|jsx|ts|tsx|cpp|c|h|hpp|cc|cxx|hxx|rs)):(.*)",
+    re.DOTALL,
 )
 
 
@@ -18,6 +23,13 @@ _TARGET_EXT_RE = re.compile(
 _quiet = False
 _porcelain = False
 
+# Cached (cwd, root) pair from the last find_project_root() call that started
+# at the current working directory. Keyed on cwd so a chdir invalidates it.
+_project_root_cache: Optional[tuple[Path, Path]] = None
+
+# Directories a wildcard glob segment never descends into
+_GLOB_SKIP_DIRS = frozenset({".git", "__pycache__", "node_modules"})
+
 
 def qprint(*args, **kwargs) -> None:
     """Print to stdout unless quiet mode is active."""
@@ -63,20 +75,28 @@ def find_project_root(start: Optional[Path] = None) -> Path:
     Returns:
         The project root directory.
     """
+    global _project_root_cache
     if start is None:
-        start = Path.cwd()
-    current = start.resolve()
-
-    # Check current directory first
-    if (current / ".git").exists():
-        return current
-
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    # Fall back to current directory
-    return start.resolve()
+        cwd = Path.cwd()
+        if _project_root_cache is not None and _project_root_cache[0] == cwd:
+            return _project_root_cache[1]
+        root = find_project_root(cwd)
+        _project_root_cache = (cwd, root)
+        return root
+    start = start.resolve()
+
+    # Walk up with plain strings to avoid a Path allocation per level.
+    # os.path.exists (not isdir) so worktrees with a .git file still match.
+    current = str(start)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    # Fall back to the starting directory
+    return start
 
 
 def parse_target(target: str) -> tuple[str, Optional[str]]:
@@ -97,11 +117,9 @@ def parse_target(target: str) -> tuple[str, Optional[str]]:
 
     # Look for known file extensions followed by colon, or glob patterns ending
     # in a known extension followed by colon (e.g., "*.py:" or "test_*.py:")
-    match = _TARGET_EXT_RE.search(target)
+    match = _TARGET_EXT_RE.match(target)
     if match:
-        idx = match.end() - 1  # Position of the colon
-        path = target[:idx]
-        identifier = target[idx + 1:]
+        path, identifier = match.groups()
         return path, identifier if identifier else None
 
     # Fallback: if path part looks like a glob pattern (contains * or ?),
@@ -115,40 +133,118 @@ def parse_target(target: str) -> tuple[str, Optional[str]]:
     return target, None
 
 
-def expand_glob_target(root: Path, target: str) -> list[tuple[str, Optional[str]]]:
+def expand_glob_target(
+    root: Path,
+    target: str,
+    glob_cache: Optional[dict[str, tuple[str, ...]]] = None,
+) -> list[tuple[str, Optional[str]]]:
     """Expand a target with glob patterns in the path.
 
     Args:
         root: Project root directory.
         target: Target like 'tests/*.py:func' or 'src/**/*.py'
+        glob_cache: Optional dict of matches by pattern, shared by the targets
+            of one command so e.g. 'src/*.py:foo' 'src/*.py:bar' glob once.
 
     Returns:
         List of (path, identifier) tuples for each matching file.
     """
-    import glob
-
     path, identifier = parse_target(target)
 
     # Check if path contains glob characters
     if "*" not in path and "?" not in path:
         return [(path, identifier)]
 
-    # Expand the glob relative to root
-    full_pattern = str(root / path)
-    matches = glob.glob(full_pattern, recursive=True)
+    if glob_cache is None:
+        matches = _glob_relative(root, path)
+    else:
+        if path not in glob_cache:
+            glob_cache[path] = _glob_relative(root, path)
+        matches = glob_cache[path]
 
     if not matches:
         return [(path, identifier)]  # Return as-is, will error later
 
-    # Convert back to relative paths
-    results = []
-    for match in sorted(matches):
-        rel_path = str(Path(match).relative_to(root))
-        # Normalize to forward slashes
-        rel_path = rel_path.replace("\\", "/")
-        results.append((rel_path, identifier))
+    return [(rel_path, identifier) for rel_path in matches]
+
+
+def _glob_relative(root: Path, pattern: str) -> tuple[str, ...]:
+    """Expand a glob pattern relative to root.
+
+    The pattern is matched one path segment at a time, so directories that
+    cannot match the next segment are never entered. Wildcard segments skip
+    hidden entries (as glob does) and never descend into _GLOB_SKIP_DIRS.
+    Only files are returned.
 
-    return results
+    Returns:
+        Sorted tuple of matching paths, relative to root with forward slashes.
+    """
+    segments = [seg for seg in pattern.replace("\\", "/").split("/") if seg not in ("", ".")]
+    results: set[str] = set()
+    if segments:
+        _glob_walk(str(root), "", segments, results)
+    return tuple(sorted(results))
+
+
+def _glob_walk(base: str, rel: str, segments: list[str], results: set[str]) -> None:
+    """Match segments against the directory base/rel, collecting files into results."""
+    seg, rest = segments[0], segments[1:]
+    directory = os.path.join(base, rel) if rel else base
+
+    if seg == "**":
+        # '**' matches zero or more directories
+        if rest:
+            _glob_walk(base, rel, rest, results)
+        for entry in _scan_dir(directory):
+            if entry.name.startswith("."):
+                continue
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir():
+                if entry.name not in _GLOB_SKIP_DIRS:
+                    _glob_walk(base, child, segments, results)
+            elif not rest and entry.is_file():
+                results.add(child)
+        return
+
+    if not any(c in seg for c in "*?["):
+        # Literal segment: check it directly instead of listing the directory
+        child = f"{rel}/{seg}" if rel else seg
+        full = os.path.join(base, child)
+        if rest:
+            if os.path.isdir(full):
+                _glob_walk(base, child, rest, results)
+        elif os.path.isfile(full):
+            results.add(child)
+        return
+
+    matcher = _compile_glob_segment(os.path.normcase(seg))
+    for entry in _scan_dir(directory):
+        name = entry.name
+        if name.startswith(".") and not seg.startswith("."):
+            continue
+        if not matcher(os.path.normcase(name)):
+            continue
+        child = f"{rel}/{name}" if rel else name
+        if rest:
+            if name not in _GLOB_SKIP_DIRS and entry.is_dir():
+                _glob_walk(base, child, rest, results)
+        elif entry.is_file():
+            results.add(child)
+
+
+def _scan_dir(directory: str) -> list[os.DirEntry]:
+    """List a directory, treating unreadable or missing directories as empty."""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glob_segment(segment: str):
+    """Compile a single glob path segment to a match function."""
+    return re.compile(fnmatch.translate(segment)).match
 
 
 def cmd_add(args: argparse.Namespace) -> int:
@@ -161,8 +257,9 @@ def cmd_add(args: argparse.Namespace) -> int:
     any_success = False
     any_error = False
 
+    glob_cache = {}
     for target in args.targets:
-        for path, identifier in expand_glob_target(root, target):
+        for path, identifier in expand_glob_target(root, target, glob_cache):
             try:
                 if identifier:
                     added, skipped = guard.add_identifier(path, identifier)
@@ -262,8 +359,9 @@ def cmd_update(args: argparse.Namespace) -> int:
                     print(f"  Run 'ai-guard remove {target}' to remove this entry.", file=sys.stderr)
                     any_error = True
     else:
+        glob_cache = {}
         for target in args.targets:
-            for path, identifier in expand_glob_target(root, target):
+            for path, identifier in expand_glob_target(root, target, glob_cache):
                 try:
                     entries = guard.update(path, identifier)
                     for entry in entries:
@@ -294,8 +392,9 @@ def cmd_remove(args: argparse.Namespace) -> int:
         return 1
 
     all_removed = []
+    glob_cache = {}
     for target in args.targets:
-        for path, identifier in expand_glob_target(root, target):
+        for path, identifier in expand_glob_target(root, target, glob_cache):
             removed = guard.remove(path, identifier)
             all_removed.extend(removed)
 
@@ -322,11 +421,11 @@ def cmd_list(args: argparse.Namespace) -> int:
         qprint("No protected entries")
         return 0
 
-    for entry in entries:
-        if _porcelain:
-            pprint(entry_target(entry))
-        else:
-            qprint(format_entry(entry))
+    # One write for the whole listing rather than a print per entry
+    if _porcelain:
+        pprint("\n".join(entry_target(entry) for entry in entries))
+    else:
+        qprint("\n".join(format_entry(entry) for entry in entries))
 
     return 0
 
@@ -338,8 +437,19 @@ def cmd_verify(args: argparse.Namespace) -> int:
     if _check_conflicts(guard):
         return 1
 
+    paths = None
+    if args.staged:
+        paths = _staged_paths(root)
+        if paths is None:
+            # Fail closed: check everything rather than nothing
+            print(
+                "Warning: Could not list staged files with 'git diff --cached', "
+                "verifying all entries",
+                file=sys.stderr,
+            )
+
     try:
-        failures = guard.verify()
+        failures = guard.verify(paths, use_cache=not args.no_cache)
     except ImportError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -349,19 +459,39 @@ def cmd_verify(args: argparse.Namespace) -> int:
         return 0
 
     if _porcelain:
-        for entry, reason in failures:
-            pprint(entry_target(entry))
+        pprint("\n".join(entry_target(entry) for entry, _ in failures))
     else:
-        print("AI-Guard violations found:", file=sys.stderr)
-        for entry, reason in failures:
-            if entry.identifier:
-                print(f"  {entry.path}:{entry.identifier} - {reason}", file=sys.stderr)
-            else:
-                print(f"  {entry.path} - {reason}", file=sys.stderr)
+        lines = ["AI-Guard violations found:"]
+        lines.extend(f"  {entry_target(entry)} - {reason}" for entry, reason in failures)
+        print("\n".join(lines), file=sys.stderr)
 
     return 1
 
 
+def _staged_paths(root: Path) -> Optional[set[str]]:
+    """List the paths staged for commit, relative to root.
+
+    Renames are reported as a deletion plus an addition so that a protected
+    file moved away is still checked under its old path.
+
+    Returns:
+        Set of staged paths, or None if git could not be run.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--name-only", "--no-renames", "-z"],
+            capture_output=True, cwd=root,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    names = result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+    return {name for name in names if name}
+
+
 def cmd_resolve(args: argparse.Namespace) -> int:
     """Resolve .ai-guard after a merge."""
     root = find_project_root()
@@ -399,7 +529,7 @@ if ! command -v ai-guard >/dev/null 2>&1; then
     echo "Warning: ai-guard not found on PATH, skipping verify"
     exit 0
 fi
-ai-guard verify
+ai-guard verify --staged
 if [ $? -ne 0 ]; then
     echo ""
     echo "Commit blocked: Protected code was modified."
@@ -592,7 +722,7 @@ def cmd_install_git_hooks(args: argparse.Namespace) -> int:
     # 1. Pre-commit hook
     print("\n" + "=" * 60)
     print("1. Pre-commit hook")
-    print("   Runs 'ai-guard verify' before each commit. Blocks the")
+    print("   Runs 'ai-guard verify --staged' before each commit. Blocks the")
     print("   commit if protected code was modified without updating hashes.")
     _install_hook_section(hooks_dir / "pre-commit", "pre-commit", _PRE_COMMIT_SECTION)
 
@@ -781,6 +911,16 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     # verify command
     verify_parser = subparsers.add_parser("verify", help="Verify all protected entries")
+    verify_parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Only verify entries for files staged for commit (used by the pre-commit hook)",
+    )
+    verify_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-hash every file instead of trusting the verify cache",
+    )
     verify_parser.set_defaults(func=cmd_verify)
 
     # resolve command
@@ -808,9 +948,9 @@ def main(argv: Optional[list[str]] = None) -> int:
             "Interactively install git hooks and merge configuration for ai-guard.\n"
             "Each item is shown with its content and you are prompted before installation.\n\n"
             "Available items:\n\n"
-            "  pre-commit      Runs 'ai-guard verify' before each commit. Blocks the\n"
-            "                  commit if protected code was modified without updating\n"
-            "                  hashes.\n\n"
+            "  pre-commit      Runs 'ai-guard verify --staged' before each commit.\n"
+            "                  Blocks the commit if protected code in staged files\n"
+            "                  was modified without updating hashes.\n\n"
             "  post-merge      Runs 'ai-guard resolve' after a merge completes.\n"
             "                  Recomputes hashes for all protected entries to match\n"
             "                  the merged source tree.\n\n"
@@ -1,24 +1,62 @@
 """Core functionality for ai-guard."""
 
-import fnmatch
 import hashlib
+import json
+import os
+import posixpath
 import re
+import stat
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from ai_guard.parsers.base import Identifier
 
 # Conflict marker patterns (git 2-way and 3-way/diff3 styles)
 _CONFLICT_MARKER_RE = re.compile(r'^(<{7}|={7}|>{7}|\|{7})\s', re.MULTILINE)
 
+# Key of the .ai-guard self-protection entry
+_SELF_KEY = (".ai-guard", None)
+
+# Read size used when streaming files through the hasher
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Verify cache file (inside .git) mapping path -> stat and computed hashes
+_VERIFY_CACHE_NAME = "ai-guard-verify-cache.json"
+
+# Files modified more recently than this are not cached (see _verify_file)
+_RACY_WINDOW_NS = 2 * 1_000_000_000
 
-@dataclass
+
+@dataclass(frozen=True)
 class ProtectedEntry:
-    """A protected file or identifier entry."""
+    """A protected file or identifier entry.
+
+    Entries are immutable; replace an entry to change its hash. Slots keep
+    large .ai-guard files cheap to hold in memory.
+    """
+
+    __slots__ = ("path", "identifier", "hash", "line")
 
     path: str
     identifier: Optional[str]  # None for whole-file protection
     hash: str
 
+    def __post_init__(self) -> None:
+        # The entry's line in the .ai-guard file, serialized once
+        if self.identifier:
+            line = f"{self.path}:{self.identifier}:{self.hash}"
+        else:
+            line = f"{self.path}:{self.hash}"
+        object.__setattr__(self, "line", line)
+
+    def __reduce__(self):
+        # Frozen slotted instances can't be restored attribute by attribute,
+        # so copy and pickle go through __init__ instead.
+        return (type(self), (self.path, self.identifier, self.hash))
+
     @property
     def is_self_protection(self) -> bool:
         """Whether this is the .ai-guard self-protection entry."""
@@ -26,9 +64,7 @@ class ProtectedEntry:
 
     def to_line(self) -> str:
         """Convert to a line in the .ai-guard file."""
-        if self.identifier:
-            return f"{self.path}:{self.identifier}:{self.hash}"
-        return f"{self.path}:{self.hash}"
+        return self.line
 
     @classmethod
     def from_line(cls, line: str) -> Optional["ProtectedEntry"]:
@@ -43,39 +79,30 @@ class ProtectedEntry:
             ProtectedEntry if valid, None otherwise.
         """
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             return None
 
-        # The hash is always the last 16 hex characters after the final colon
-        # Split from the right to handle identifiers containing colons (e.g., C++ ::)
-        last_colon = line.rfind(":")
-        if last_colon == -1:
+        # The hash is always the last field. Partition from the right so
+        # identifiers containing colons (e.g., C++ ::) stay intact.
+        rest, sep, hash_part = line.rpartition(":")
+        if not sep:
             return None
 
-        hash_part = line[last_colon + 1:]
-        rest = line[:last_colon]
-
-        # Now split the rest into path and optional identifier
-        # The path is everything before the first colon that follows a file extension
-        # For simplicity, find the first colon in rest
-        first_colon = rest.find(":")
-        if first_colon == -1:
-            # Whole file: path:hash (but we already removed hash)
-            # This means: rest = path
-            return cls(path=normalize_path(rest), identifier=None, hash=hash_part)
-
-        path = rest[:first_colon]
-        identifier = rest[first_colon + 1:]
-
-        if identifier:
-            return cls(path=normalize_path(path), identifier=identifier, hash=hash_part)
-        else:
-            return cls(path=normalize_path(path), identifier=None, hash=hash_part)
+        # The path is everything before the first remaining colon; whatever
+        # follows it is the identifier (empty for whole-file protection).
+        # Only the separators are normalized: the path is kept as written so
+        # the self-protection hash over these lines still matches.
+        path, _, identifier = rest.partition(":")
+        return cls(
+            path=path.replace("\\", "/"),
+            identifier=identifier or None,
+            hash=hash_part,
+        )
 
 
 def normalize_path(path: str) -> str:
-    """Normalize path separators to forward slashes."""
-    return path.replace("\\", "/")
+    """Normalize a relative path: forward slashes, no "./" or "x/.." parts."""
+    return posixpath.normpath(path.replace("\\", "/"))
 
 
 def compute_hash(content: str) -> str:
@@ -90,45 +117,218 @@ def compute_hash(content: str) -> str:
     Returns:
         The first 16 characters of the hex digest.
     """
-    normalized = content.replace('\r', '')
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    # CR is a single byte in UTF-8 and never part of a multi-byte sequence,
+    # so stripping it from the encoded bytes matches stripping it from the str.
+    data = content.encode("utf-8").translate(None, b"\r")
+    # The algorithm and truncation are part of the .ai-guard format: every
+    # recorded hash depends on them, so they must not change.
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()[:16]
 
 
 def compute_file_hash(filepath: Path) -> str:
     """Compute a hash of a file's contents.
 
+    The file is streamed as raw bytes with newlines normalized the same way
+    text-mode reading does (CRLF and lone CR become LF), so hashes match
+    those recorded by earlier versions that read the file as text.
+
     Args:
         filepath: Path to the file.
 
     Returns:
         The hash of the file contents.
     """
-    content = filepath.read_text(encoding="utf-8")
-    return compute_hash(content)
-
-
-def compute_identifier_hash(filepath: Path, identifier: str) -> Optional[str]:
+    hasher = hashlib.sha256(usedforsecurity=False)
+    pending_cr = False
+    # Read into one reusable buffer, unbuffered, so chunks without a CR go
+    # from the kernel to the hasher without any intermediate copies.
+    buf = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            if not pending_cr and buf.find(b"\r", 0, n) == -1:
+                hasher.update(view[:n])
+                continue
+            chunk = bytes(view[:n])
+            if pending_cr:
+                chunk = b"\r" + chunk
+                pending_cr = False
+            # Hold back a trailing CR: it may be the first half of a CRLF
+            # split across two reads.
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                pending_cr = True
+            if b"\r" in chunk:
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            hasher.update(chunk)
+    if pending_cr:
+        hasher.update(b"\n")
+    return hasher.hexdigest()[:16]
+
+
+def compute_identifier_hash(
+    filepath: Path, identifier: str, source: Optional[str] = None
+) -> Optional[str]:
     """Compute a hash of an identifier's source code.
 
     Args:
         filepath: Path to the file.
         identifier: Name of the identifier.
+        source: The file's contents, if already read. Read from disk if None.
 
     Returns:
         The hash of the identifier's source, or None if not found.
     """
+    return compute_identifier_hashes(filepath, [identifier], source)[identifier]
+
+
+def compute_identifier_hashes(
+    filepath: Path, identifiers: list[str], source: Optional[str] = None
+) -> dict[str, Optional[str]]:
+    """Compute hashes of several identifiers in one file.
+
+    The file is read and parsed once, however many identifiers are requested.
+
+    Args:
+        filepath: Path to the file.
+        identifiers: Names of the identifiers.
+        source: The file's contents, if already read. Read from disk if None.
+
+    Returns:
+        Dict mapping each identifier to its hash, or None if not found.
+    """
     from ai_guard.parsers.base import get_parser_for_file
 
     parser = get_parser_for_file(str(filepath))
     if not parser:
-        return None
+        return {identifier: None for identifier in identifiers}
+
+    if source is None:
+        source = filepath.read_text(encoding="utf-8")
+    found = parser.extract_identifiers(source, identifiers)
+    return {
+        identifier: compute_hash(ident.source) if ident else None
+        for identifier, ident in found.items()
+    }
+
+
+def _load_verify_cache(cache_path: Path) -> dict[str, dict]:
+    """Load the verify cache, returning an empty cache if missing or unusable."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _verify_cache_version():
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
 
-    source = filepath.read_text(encoding="utf-8")
-    ident = parser.extract_identifier(source, identifier)
-    if not ident:
-        return None
+def _save_verify_cache(cache_path: Path, files: dict[str, dict]) -> None:
+    """Write the verify cache. Failures are ignored; the cache is optional."""
+    data = {"version": _verify_cache_version(), "files": files}
+    try:
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass
 
-    return compute_hash(ident.source)
+
+def _verify_cache_version() -> str:
+    """Cache version; tied to the package version so parser changes invalidate it."""
+    from ai_guard import __version__
+    return __version__
+
+
+def _stat_paths(root: Path, paths: list[str]) -> dict[str, Optional[os.stat_result]]:
+    """Stat protected files, listing each shared directory only once on Windows.
+
+    On Windows, directories holding several protected files are read with
+    os.scandir, whose entries carry their stat data. Everything else, and
+    anything not found in a listing (e.g. due to case-insensitive
+    filesystems), uses os.stat.
+
+    Returns:
+        Dict mapping each path to its stat result, or None if it is missing
+        or can't be reached.
+    """
+    by_dir: dict[str, list[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    results: dict[str, Optional[os.stat_result]] = {}
+    for dirname, dir_paths in by_dir.items():
+        listing: dict[str, os.DirEntry] = {}
+        # Only Windows serves DirEntry.stat() from the directory listing. On
+        # POSIX it makes a real stat call, so reading the whole directory
+        # first would be extra work on top of one stat per file.
+        if os.name == "nt" and len(dir_paths) > 1:
+            try:
+                with os.scandir(os.path.join(root, dirname)) as it:
+                    listing = {dir_entry.name: dir_entry for dir_entry in it}
+            except OSError:
+                pass
+
+        for path in dir_paths:
+            st = None
+            dir_entry = listing.get(os.path.basename(path))
+            if dir_entry is not None:
+                try:
+                    st = dir_entry.stat()
+                except OSError:
+                    pass
+            if st is None:
+                try:
+                    st = os.stat(os.path.join(root, path))
+                except OSError:
+                    # Missing, or unreachable (a parent replaced by a file,
+                    # a symlink loop, no permission): report as not found
+                    pass
+            results[path] = st
+    return results
+
+
+def _atomic_write_text(filepath: Path, content: str) -> None:
+    """Write a text file atomically.
+
+    The content goes to a temporary file in the same directory, which then
+    replaces the target, so a crash mid-write never leaves a truncated file.
+    The target's permissions are kept (or the umask default for a new file),
+    and a symlinked target is written through, leaving the link in place.
+    """
+    target = Path(os.path.realpath(filepath))
+    try:
+        mode: Optional[int] = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Create the temp file ourselves rather than with mkstemp (always 0600) so
+    # a new file gets the umask default without reading the process umask
+    tmp_name = os.path.join(target.parent, f"{target.name}.{os.urandom(6).hex()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_name, flags, 0o666 if mode is None else mode)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _entries_hash(entries: Iterable[ProtectedEntry]) -> str:
+    """Compute the self-protection hash over all other entries."""
+    lines = [entry.line for entry in entries if not entry.is_self_protection]
+    return compute_hash("\n".join(lines) + "\n" if lines else "")
 
 
 class GuardFile:
@@ -142,25 +342,57 @@ class GuardFile:
         """
         self.root = root
         self.filepath = root / ".ai-guard"
-        self.entries: list[ProtectedEntry] = []
+        # Entries keyed by target, in file order
+        self._by_key: dict[tuple[str, Optional[str]], ProtectedEntry] = {}
         self.has_conflicts: bool = False
+        # Self-protection hash of the entries as last read from or written
+        # to disk; None if the file does not exist.
+        self._disk_hash: Optional[str] = None
+        # Raw .ai-guard content as last read or written; None if no file.
+        self._content: Optional[str] = None
         self._load()
 
+    @property
+    def entries(self) -> tuple[ProtectedEntry, ...]:
+        """All protected entries, in file order.
+
+        A read-only snapshot: change entries with add_file, add_identifier,
+        update and remove, or assign a whole new sequence.
+        """
+        return tuple(self._by_key.values())
+
+    @entries.setter
+    def entries(self, entries: Iterable[ProtectedEntry]) -> None:
+        self._by_key = {}
+        for entry in entries:
+            self._by_key.setdefault((entry.path, entry.identifier), entry)
+
     def _load(self) -> None:
-        """Load entries from the .ai-guard file."""
-        self.entries = []
+        """Load entries from the .ai-guard file.
+
+        If a target appears more than once (e.g., after a union merge), the
+        first entry is kept; 'ai-guard resolve' recomputes it anyway.
+        """
+        self._by_key = {}
         self.has_conflicts = False
+        self._disk_hash = None
+        self._content = None
         if not self.filepath.exists():
             return
 
         content = self.filepath.read_text(encoding="utf-8")
+        self._content = content
         if _CONFLICT_MARKER_RE.search(content):
             self.has_conflicts = True
 
-        for line in content.splitlines():
-            entry = ProtectedEntry.from_line(line)
-            if entry:
-                self.entries.append(entry)
+        disk_entries = [
+            entry for entry in map(ProtectedEntry.from_line, content.splitlines())
+            if entry is not None
+        ]
+        self.entries = disk_entries
+        # Hash every line as written, duplicates included, so tampering by
+        # duplicating an entry is still detected.
+        self._disk_hash = _entries_hash(disk_entries)
 
     def save(self) -> None:
         """Save entries to the .ai-guard file.
@@ -171,35 +403,29 @@ class GuardFile:
         # Ensure .ai-guard protects itself
         self._ensure_self_protection()
 
-        # Build content excluding self-protection line for hash computation
-        other_entries = [e for e in self.entries if not e.is_self_protection]
-        other_lines = [entry.to_line() for entry in other_entries]
-        content_to_hash = "\n".join(other_lines) + "\n" if other_lines else ""
-
         # Compute hash of the protected entries (excluding self-protection)
-        self_hash = compute_hash(content_to_hash)
+        self_hash = _entries_hash(self.entries)
 
         # Update the self-protection entry with the computed hash
-        for i, entry in enumerate(self.entries):
-            if entry.is_self_protection:
-                self.entries[i] = ProtectedEntry(
-                    path=".ai-guard", identifier=None, hash=self_hash
-                )
-                break
+        self._by_key[_SELF_KEY] = ProtectedEntry(
+            path=".ai-guard", identifier=None, hash=self_hash
+        )
 
         # Write the complete file
-        lines = [entry.to_line() for entry in self.entries]
-        self.filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        lines = [entry.line for entry in self._by_key.values()]
+        content = "\n".join(lines) + "\n"
+        _atomic_write_text(self.filepath, content)
+        self._content = content
+        self._disk_hash = self_hash
 
     def _ensure_self_protection(self) -> None:
         """Ensure .ai-guard file is in the protection list."""
-        for entry in self.entries:
-            if entry.is_self_protection:
-                return
+        if _SELF_KEY in self._by_key:
+            return
 
         # Add self-protection entry with placeholder hash (will be computed in save())
         entry = ProtectedEntry(path=".ai-guard", identifier=None, hash="0" * 16)
-        self.entries.insert(0, entry)  # Put it first
+        self._by_key = {_SELF_KEY: entry, **self._by_key}  # Put it first
 
     def add_file(self, path: str) -> tuple[Optional[ProtectedEntry], Optional[ProtectedEntry]]:
         """Add whole-file protection.
@@ -217,12 +443,12 @@ class GuardFile:
         file_hash = compute_file_hash(filepath)
 
         # Check for existing entry
-        for entry in self.entries:
-            if entry.path == normalized and entry.identifier is None:
-                return None, entry
+        existing = self._by_key.get((normalized, None))
+        if existing:
+            return None, existing
 
         entry = ProtectedEntry(path=normalized, identifier=None, hash=file_hash)
-        self.entries.append(entry)
+        self._by_key[(normalized, None)] = entry
         return entry, None
 
     def add_identifier(self, path: str, identifier: str) -> tuple[list[ProtectedEntry], list[ProtectedEntry]]:
@@ -238,10 +464,22 @@ class GuardFile:
             Tuple of (added, skipped) lists. Existing entries are skipped
             rather than overwritten.
         """
+        normalized = normalize_path(path)
+        all_identifiers = self._expand_identifier(path, identifier)
+        return self._add_identifiers(normalized, all_identifiers)
+
+    def _expand_identifier(self, path: str, identifier: str) -> list["Identifier"]:
+        """Read a file and expand an identifier pattern against it.
+
+        Returns:
+            The matching Identifier objects.
+
+        Raises:
+            ValueError: If no parser handles the file or nothing matches.
+        """
         from ai_guard.parsers.base import get_parser_for_file
 
-        normalized = normalize_path(path)
-        filepath = self.root / normalized
+        filepath = self.root / normalize_path(path)
 
         parser = get_parser_for_file(str(filepath))
         if not parser:
@@ -256,16 +494,17 @@ class GuardFile:
 
         if not all_identifiers:
             raise ValueError(f"No identifiers matching '{identifier}' found in {path}")
+        return all_identifiers
 
+    def _add_identifiers(
+        self, normalized: str, all_identifiers: list["Identifier"]
+    ) -> tuple[list[ProtectedEntry], list[ProtectedEntry]]:
+        """Add entries for already-expanded identifiers, skipping existing ones."""
         added = []
         skipped = []
         for ident in all_identifiers:
             # Check for existing entry
-            existing = next(
-                (e for e in self.entries
-                 if e.path == normalized and e.identifier == ident.name),
-                None,
-            )
+            existing = self._by_key.get((normalized, ident.name))
             if existing:
                 skipped.append(existing)
                 continue
@@ -274,7 +513,7 @@ class GuardFile:
             entry = ProtectedEntry(
                 path=normalized, identifier=ident.name, hash=ident_hash
             )
-            self.entries.append(entry)
+            self._by_key[(normalized, ident.name)] = entry
             added.append(entry)
 
         return added, skipped
@@ -294,23 +533,15 @@ class GuardFile:
         normalized = normalize_path(path)
 
         if identifier:
-            # Remove matching entries before re-adding
-            from ai_guard.parsers.base import get_parser_for_file
-
-            parser = get_parser_for_file(str(self.root / normalized))
-            if parser:
-                source = (self.root / normalized).read_text(encoding="utf-8")
-                all_identifiers = parser.expand_identifier_pattern(source, identifier)
-                for ident in all_identifiers:
-                    self.entries = [
-                        e for e in self.entries
-                        if not (e.path == normalized and e.identifier == ident.name)
-                    ]
-            added, _ = self.add_identifier(path, identifier)
+            # Expand once, remove the matching entries, then re-add them
+            all_identifiers = self._expand_identifier(path, identifier)
+            for ident in all_identifiers:
+                self._by_key.pop((normalized, ident.name), None)
+            added, _ = self._add_identifiers(normalized, all_identifiers)
             return added
         else:
             # Remove existing whole-file entry before re-adding
-            self.entries = [e for e in self.entries if e.path != normalized or e.identifier]
+            self._by_key.pop((normalized, None), None)
             added, _ = self.add_file(path)
             return [added]
 
@@ -326,32 +557,136 @@ class GuardFile:
         """
         normalized = normalize_path(path)
 
-        if identifier:
-            removed = [e for e in self.entries if e.path == normalized and e.identifier == identifier]
-            self.entries = [e for e in self.entries if e not in removed]
-        else:
-            removed = [e for e in self.entries if e.path == normalized and not e.identifier]
-            self.entries = [e for e in self.entries if e not in removed]
-
-        return removed
+        entry = self._by_key.pop((normalized, identifier or None), None)
+        return [entry] if entry else []
 
-    def verify(self) -> list[tuple[ProtectedEntry, str]]:
+    def verify(
+        self, paths: Optional[set[str]] = None, use_cache: bool = True
+    ) -> list[tuple[ProtectedEntry, str]]:
         """Verify all protected entries.
 
+        Entries are grouped by file and the files are checked concurrently
+        on a thread pool; file reads and hashing release the GIL.
+
+        Args:
+            paths: If given, only entries for these paths (relative to root,
+                   forward slashes) are verified.
+            use_cache: If False, every file is re-hashed rather than trusting
+                       cached hashes. Fresh results still update the cache.
+
         Returns:
-            List of (entry, reason) tuples for entries that failed verification.
+            List of (entry, reason) tuples for entries that failed
+            verification, in entry order.
         """
-        failures = []
+        # Import the parsers package (which registers every parser) here, not
+        # lazily in the workers: a worker could otherwise see parsers.base
+        # before the registry is populated and find no parser for a file.
+        import ai_guard.parsers  # noqa: F401
+
+        if paths is not None:
+            # Entries may be stored as e.g. "./config.py"; compare normalized
+            paths = {normalize_path(p) for p in paths}
+        by_path: dict[str, list[ProtectedEntry]] = {}
+        for entry in self._by_key.values():
+            if paths is not None and normalize_path(entry.path) not in paths:
+                continue
+            by_path.setdefault(entry.path, []).append(entry)
+
+        cache_path = self._verify_cache_path()
+        cache = _load_verify_cache(cache_path) if cache_path else {}
+        stats = _stat_paths(self.root, list(by_path))
+        items = [
+            (path, entries, cache.get(path) if use_cache else None, stats[path])
+            for path, entries in by_path.items()
+        ]
+
+        if len(items) > 1:
+            # Imported here: concurrent.futures (and the logging module it
+            # pulls in) is a noticeable share of CLI startup time.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor() as pool:
+                results = list(pool.map(self._verify_file, items))
+        else:
+            results = [self._verify_file(item) for item in items]
+
+        reasons: dict[tuple[str, Optional[str]], str] = {}
+        for (path, _, _, _), (file_failures, record) in zip(items, results):
+            for entry, reason in file_failures:
+                reasons[(entry.path, entry.identifier)] = reason
+            if record is not None:
+                cache[path] = record
+            else:
+                cache.pop(path, None)
+
+        if cache_path:
+            protected_paths = {path for path, _ in self._by_key}
+            _save_verify_cache(cache_path, {
+                path: record for path, record in cache.items()
+                if path in protected_paths
+            })
+
+        return [
+            (entry, reasons[key])
+            for key, entry in self._by_key.items()
+            if key in reasons
+        ]
+
+    def _verify_file(
+        self,
+        item: tuple[str, list[ProtectedEntry], Optional[dict], Optional[os.stat_result]],
+    ) -> tuple[list[tuple[ProtectedEntry, str]], Optional[dict]]:
+        """Verify all entries for one file, reading the file at most once.
+
+        Hashes are reused from the cached record when the file's mtime and
+        size are unchanged, so an untouched file is not read at all.
 
-        for entry in self.entries:
-            filepath = self.root / entry.path
+        Args:
+            item: Tuple of (path, entries for that path, cached record or None,
+                  stat result or None if the file is missing).
 
-            if not filepath.exists():
-                failures.append((entry, "file not found"))
-                continue
+        Returns:
+            Tuple of (failures, record). failures is a list of (entry, reason)
+            tuples; record holds the file's stat and computed hashes for the
+            verify cache, or None if the file should not be cached.
+        """
+        path, entries, cached, st = item
+        if st is None:
+            return [(entry, "file not found") for entry in entries], None
+        filepath = self.root / path
+
+        if (isinstance(cached, dict) and cached.get("mtime_ns") == st.st_mtime_ns
+                and cached.get("size") == st.st_size
+                and isinstance(cached.get("identifiers"), dict)):
+            record = cached
+        else:
+            record = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "identifiers": {}}
+        identifier_hashes = record["identifiers"]
+
+        # Hash every uncached identifier together so the file is parsed once
+        missing = [
+            entry.identifier for entry in entries
+            if entry.identifier and entry.identifier not in identifier_hashes
+        ]
+        source: Optional[str] = None
+        if missing and "file_hash" not in record and any(
+            not entry.identifier and not entry.is_self_protection for entry in entries
+        ):
+            # Whole-file and identifier entries both need the file: read it
+            # once, normalized as in text mode, and serve both from that.
+            with open(filepath, "rb") as f:
+                data = f.read()
+            if b"\r" in data:
+                data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            record["file_hash"] = hashlib.sha256(data, usedforsecurity=False).hexdigest()[:16]
+            source = data.decode("utf-8")
+        if missing:
+            identifier_hashes.update(compute_identifier_hashes(filepath, missing, source))
 
+        failures = []
+        for entry in entries:
             if entry.identifier:
-                current_hash = compute_identifier_hash(filepath, entry.identifier)
+                current_hash = identifier_hashes[entry.identifier]
                 if current_hash is None:
                     failures.append((entry, "identifier not found"))
                 elif current_hash != entry.hash:
@@ -361,32 +696,44 @@ class GuardFile:
                 if current_hash != entry.hash:
                     failures.append((entry, "hash mismatch"))
             else:
-                current_hash = compute_file_hash(filepath)
+                current_hash = record.get("file_hash")
+                if current_hash is None:
+                    current_hash = compute_file_hash(filepath)
+                    record["file_hash"] = current_hash
                 if current_hash != entry.hash:
                     failures.append((entry, "hash mismatch"))
 
-        return failures
+        # A cached hash may only clear a file, never condemn it: confirm any
+        # failure against the file itself.
+        if failures and record is cached:
+            return self._verify_file((path, entries, None, st))
+
+        # Don't cache .ai-guard itself (its hash comes from the loaded
+        # entries) or files modified so recently that a further change could
+        # land within the same mtime tick without altering the size.
+        if path == ".ai-guard" or time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            record = None
+        return failures, record
+
+    def _verify_cache_path(self) -> Optional[Path]:
+        """Location of the verify cache, or None if caching is unavailable.
+
+        The cache lives inside the .git directory so it is never committed.
+        """
+        git_dir = self.root / ".git"
+        if not git_dir.is_dir():
+            return None
+        return git_dir / _VERIFY_CACHE_NAME
 
     def _compute_self_protection_hash(self) -> str:
         """Compute the hash for self-protection verification.
 
         The hash is computed over all entries except the self-protection entry,
-        based on the actual file on disk (not in-memory entries).
+        as they were last read from or written to disk (not in-memory edits).
+        The file was already parsed by _load() or written by save(), so it is
+        not re-read here.
         """
-        if not self.filepath.exists():
-            return ""
-
-        # Read entries from disk
-        disk_entries = []
-        for line in self.filepath.read_text(encoding="utf-8").splitlines():
-            entry = ProtectedEntry.from_line(line)
-            if entry:
-                disk_entries.append(entry)
-
-        other_entries = [e for e in disk_entries if not e.is_self_protection]
-        other_lines = [entry.to_line() for entry in other_entries]
-        content_to_hash = "\n".join(other_lines) + "\n" if other_lines else ""
-        return compute_hash(content_to_hash)
+        return self._disk_hash if self._disk_hash is not None else ""
 
     def resolve(self) -> tuple[list[ProtectedEntry], list[str]]:
         """Resolve .ai-guard after a merge.
@@ -459,13 +806,14 @@ class GuardFile:
         """Parse all entries from .ai-guard, stripping conflict markers.
 
         Handles both clean files and files with 2-way or 3-way (diff3)
-        conflict markers.
+        conflict markers. Works from the content read by _load() rather than
+        reading the file again.
         """
-        if not self.filepath.exists():
+        if self._content is None:
             return []
 
         entries = []
-        for line in self.filepath.read_text(encoding="utf-8").splitlines():
+        for line in self._content.splitlines():
             stripped = line.strip()
             # Skip conflict marker lines
             if (stripped.startswith("<<<<<<<") or
@@ -484,4 +832,4 @@ class GuardFile:
         Returns:
             List of all ProtectedEntry objects.
         """
-        return list(self.entries)
+        return list(self._by_key.values())
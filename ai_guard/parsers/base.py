@@ -5,9 +5,12 @@ extract_identifier() and list_identifiers() methods.
 """
 
 import fnmatch
+import functools
+import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 
 @dataclass
@@ -38,6 +41,9 @@ class Parser(ABC):
     3. Implement list_identifiers() to get all identifiers in a file
     4. Register the parser in get_parser_for_file()
 
+    Parsers must be stateless: get_parser_for_file() hands out one shared
+    instance per parser class, which verify may use from several threads.
+
     Example for a hypothetical JavaScript parser:
 
         class JavaScriptParser(Parser):
@@ -75,6 +81,23 @@ class Parser(ABC):
         """
         pass
 
+    def extract_identifiers(
+        self, source: str, names: list[str]
+    ) -> dict[str, Optional[Identifier]]:
+        """Extract several identifiers from the same source code.
+
+        The default calls extract_identifier() once per name. Parsers that
+        build a syntax tree override this to parse the source only once.
+
+        Args:
+            source: The full source code of the file.
+            names: The names of the identifiers to extract.
+
+        Returns:
+            Dict mapping each name to its Identifier, or None if not found.
+        """
+        return {name: self.extract_identifier(source, name) for name in names}
+
     def expand_identifier_pattern(self, source: str, pattern: str) -> list[Identifier]:
         """Expand an identifier pattern to matching identifiers.
 
@@ -89,17 +112,40 @@ class Parser(ABC):
         Returns:
             A list of matching Identifier objects.
         """
-        all_identifiers = self.list_identifiers(source)
+        return filter_identifiers(self.list_identifiers(source), pattern)
+
 
-        if "*" in pattern or "?" in pattern:
-            return [i for i in all_identifiers if fnmatch.fnmatch(i.name, pattern)]
-        else:
-            return [i for i in all_identifiers if i.name == pattern]
+def filter_identifiers(identifiers: list[Identifier], pattern: str) -> list[Identifier]:
+    """Select the identifiers whose name matches a pattern.
+
+    Patterns containing * or ? are matched as case-sensitive wildcards;
+    anything else must match the name exactly.
+
+    Args:
+        identifiers: The identifiers to filter.
+        pattern: The name or wildcard pattern to match.
+
+    Returns:
+        The matching identifiers, in their original order.
+    """
+    if "*" in pattern or "?" in pattern:
+        match = _compile_wildcard(pattern)
+        return [i for i in identifiers if match(i.name)]
+    return [i for i in identifiers if i.name == pattern]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_wildcard(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a wildcard pattern once, however many files it is applied to."""
+    return re.compile(fnmatch.translate(pattern)).match
 
 
 # Registry of file extensions to parser classes
 _PARSER_REGISTRY: dict[str, type[Parser]] = {}
 
+# Shared parser instances, created on first use
+_PARSER_INSTANCES: dict[type[Parser], Parser] = {}
+
 
 def register_parser(extensions: list[str], parser_class: type[Parser]) -> None:
     """Register a parser for file extensions.
@@ -122,9 +168,11 @@ def get_parser_for_file(filepath: str) -> Optional[Parser]:
         A parser instance if one is registered for the file extension,
         None otherwise.
     """
-    from pathlib import Path
-    ext = Path(filepath).suffix.lower()
+    ext = os.path.splitext(filepath)[1].lower()
     parser_class = _PARSER_REGISTRY.get(ext)
-    if parser_class:
-        return parser_class()
-    return None
+    if parser_class is None:
+        return None
+    parser = _PARSER_INSTANCES.get(parser_class)
+    if parser is None:
+        parser = _PARSER_INSTANCES.setdefault(parser_class, parser_class())
+    return parser
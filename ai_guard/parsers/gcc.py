@@ -5,14 +5,134 @@ files by using GCC to preprocess and validate the code, combined with regex
 parsing for identifier extraction.
 """
 
-import fnmatch
+import bisect
+import dataclasses
+import functools
+import hashlib
 import re
 import subprocess
-import tempfile
-from pathlib import Path
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
-from ai_guard.parsers.base import Parser, Identifier, register_parser
+from ai_guard.parsers.base import Parser, Identifier, filter_identifiers, register_parser
+
+
+@functools.lru_cache(maxsize=4096)
+def _function_pattern(name: str) -> re.Pattern:
+    """Compiled pattern for the function definition of ``name``."""
+    return re.compile(
+        rf"""
+        ^[ \t]*
+        (?:(?:__\w+__\s*\([^)]*\)\s*)*)
+        [\w_][\w_\s\*&:<>,]*?
+        [\s\*&]
+        {re.escape(name)}
+        \s*
+        \([^)]*\)
+        \s*
+        (?:const\s*)?
+        (?:override\s*)?
+        (?:noexcept(?:\([^)]*\))?\s*)?
+        \s*
+        \{{
+        """,
+        re.MULTILINE | re.VERBOSE
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _struct_class_pattern(name: str) -> re.Pattern:
+    """Compiled pattern for the struct/class/union/enum definition of ``name``."""
+    return re.compile(
+        rf"""
+        ^[ \t]*
+        (?P<keyword>struct|class|union|enum)
+        \s+
+        {re.escape(name)}
+        \s*
+        (?::\s*[^{{]+)?
+        \s*
+        \{{
+        """,
+        re.MULTILINE | re.VERBOSE
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _typedef_pattern(name: str) -> re.Pattern:
+    """Compiled pattern for the simple typedef of ``name``."""
+    return re.compile(
+        rf"^[ \t]*typedef\s+.+?\s+{re.escape(name)}\s*;",
+        re.MULTILINE
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _global_var_pattern(name: str) -> re.Pattern:
+    """Compiled pattern for the global variable definition of ``name``."""
+    return re.compile(
+        rf"""
+        ^[ \t]*
+        [\w_][\w_\s\*&]+?
+        [\s\*&]
+        {re.escape(name)}
+        \s*
+        (?:\[[^\]]*\])?
+        \s*
+        (?:=\s*[^;]+)?
+        \s*;
+        """,
+        re.MULTILINE | re.VERBOSE
+    )
+
+
+# Syntax check results keyed by (compiler, language, source digest), oldest
+# first; bounded so a long-lived process doesn't grow it without limit.
+# Guarded by _SYNTAX_CACHE_LOCK since verify checks files from worker threads.
+_SYNTAX_CACHE: dict[tuple[str, str, bytes], bool] = {}
+_SYNTAX_CACHE_SIZE = 256
+_SYNTAX_CACHE_LOCK = threading.Lock()
+
+# list_identifiers/list_struct_members results keyed by (parser class, struct
+# name or None, source), oldest first. Commands that expand several
+# identifiers in one file, such as update --all, then parse it once. Guarded
+# by _LIST_CACHE_LOCK since verify lists files from worker threads.
+_LIST_CACHE: dict[tuple[type, Optional[str], str], tuple[Identifier, ...]] = {}
+_LIST_CACHE_SIZE = 32
+_LIST_CACHE_LOCK = threading.Lock()
+
+# Characters that can change _find_matching_brace's state outside comments
+_BRACE_SCAN_RE = re.compile(r"[{}\"'/]")
+
+
+class _LineIndex:
+    """A source string with its newline offsets, for fast line lookups.
+
+    Built once per parse and passed down rather than stored on the parser,
+    since parser instances are shared between threads.
+    """
+
+    __slots__ = ("source", "_newlines")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._newlines = [m.start() for m in re.finditer("\n", source)]
+
+    def line_at(self, pos: int) -> int:
+        """1-based line of position pos, i.e. source[:pos].count("\\n") + 1."""
+        return bisect.bisect_left(self._newlines, pos) + 1
+
+    def text(self, start_line: int, end_line: int) -> str:
+        """Lines start_line..end_line (1-based, inclusive) without the final newline.
+
+        Equivalent to "\\n".join(source.split("\\n")[start_line - 1:end_line]),
+        but taken as a single slice of the source.
+        """
+        if end_line < start_line:
+            return ""
+        start = self._newlines[start_line - 2] + 1 if start_line > 1 else 0
+        end = self._newlines[end_line - 1] if end_line <= len(self._newlines) else len(self.source)
+        return self.source[start:end]
 
 
 class GCCParserBase(Parser):
@@ -33,8 +153,7 @@ class GCCParserBase(Parser):
         r"""
         ^[ \t]*                     # Start of line, optional indent
         (?P<attrs>(?:__\w+__\s*\([^)]*\)\s*)*)  # Optional GCC attributes
-        (?P<modifiers>(?:static|inline|extern|virtual|const|unsigned|signed|long|short)\s+)*
-        (?P<return_type>[\w_][\w_\s\*&:<>,]*?)  # Return type
+        (?P<return_type>[\w_][\w_\s\*&:<>,]*?)  # Return type and modifiers
         \s+
         (?P<name>[\w_]+)            # Function name
         \s*
@@ -113,7 +232,6 @@ class GCCParserBase(Parser):
     MEMBER_FIELD_PATTERN = re.compile(
         r"""
         ^[ \t]*
-        (?:(?:static|const|volatile|mutable)\s+)*
         [\w_][\w_\s\*&:<>,]*?
         [\s\*&]
         (?P<name>[\w_]+)
@@ -130,8 +248,7 @@ class GCCParserBase(Parser):
     GLOBAL_VAR_PATTERN = re.compile(
         r"""
         ^[ \t]*                     # Start of line
-        (?:static\s+|extern\s+|const\s+|volatile\s+)*  # Modifiers
-        (?P<type>[\w_][\w_\s\*&]+?) # Type
+        (?P<type>[\w_][\w_\s\*&]+?) # Type and modifiers
         \s+
         (?P<name>[\w_]+)            # Variable name
         \s*
@@ -152,108 +269,147 @@ class GCCParserBase(Parser):
         Returns:
             True if syntax is valid, False otherwise.
         """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=f".{self.LANGUAGE}", delete=False
-        ) as f:
-            f.write(source)
-            f.flush()
-            temp_path = f.name
+        # Results are remembered per compiler and source for the life of the
+        # process, so re-checking unchanged code skips the subprocess.
+        key = (
+            self.COMPILER,
+            self.LANGUAGE,
+            hashlib.sha256(source.encode("utf-8"), usedforsecurity=False).digest(),
+        )
+        with _SYNTAX_CACHE_LOCK:
+            cached = _SYNTAX_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        valid = self._run_syntax_check(source)
+        if valid is None:
+            # The compiler could not be run; don't remember that
+            return False
+        with _SYNTAX_CACHE_LOCK:
+            if key not in _SYNTAX_CACHE and len(_SYNTAX_CACHE) >= _SYNTAX_CACHE_SIZE:
+                _SYNTAX_CACHE.pop(next(iter(_SYNTAX_CACHE)), None)
+            _SYNTAX_CACHE[key] = valid
+        return valid
 
+    def _run_syntax_check(self, source: str) -> Optional[bool]:
+        """Run the compiler in syntax-only mode.
+
+        Returns:
+            Whether the syntax is valid, or None if the compiler could not be
+            run or timed out.
+        """
+        # Feed the source on stdin ("-") rather than through a temp file
         try:
             result = subprocess.run(
-                [self.COMPILER, "-fsyntax-only", "-x", self.LANGUAGE, temp_path],
+                [self.COMPILER, "-fsyntax-only", "-x", self.LANGUAGE, "-"],
+                input=source.encode("utf-8"),
                 capture_output=True,
                 timeout=10,
             )
             return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+            return None
 
     def list_identifiers(self, source: str) -> list[Identifier]:
         """List all top-level identifiers in C/C++ source code."""
+        return self._cached_list(None, source, lambda: self._list_identifiers(source))
+
+    def _cached_list(
+        self,
+        struct_name: Optional[str],
+        source: str,
+        compute: Callable[[], list[Identifier]],
+    ) -> list[Identifier]:
+        """Return a cached identifier listing, calling compute on a miss.
+
+        struct_name is None for the top-level listing of source.
+        """
+        key = (type(self), struct_name, source)
+        with _LIST_CACHE_LOCK:
+            cached = _LIST_CACHE.get(key)
+        if cached is None:
+            cached = tuple(compute())
+            with _LIST_CACHE_LOCK:
+                if key not in _LIST_CACHE and len(_LIST_CACHE) >= _LIST_CACHE_SIZE:
+                    _LIST_CACHE.pop(next(iter(_LIST_CACHE)), None)
+                _LIST_CACHE[key] = cached
+        # Identifiers are mutable; hand out copies so callers can't change
+        # what later lookups return
+        return [dataclasses.replace(ident) for ident in cached]
+
+    def _list_identifiers(self, source: str) -> list[Identifier]:
+        """Scan source for top-level identifiers; see list_identifiers."""
         identifiers = []
-        lines = source.split("\n")
+        index = _LineIndex(source)
         seen_names = set()
+        # Each pass needs a literal its pattern can't match without, so a
+        # substring test skips passes that would find nothing
+        has_brace = "{" in source
 
         # Find functions
-        for match in self.FUNCTION_PATTERN.finditer(source):
-            name = match.group("name")
-            if name in seen_names:
-                continue
-            # Skip control flow keywords
-            if name in ("if", "while", "for", "switch", "return", "sizeof"):
-                continue
-            ident = self._find_function(source, lines, name)
-            if ident:
-                identifiers.append(ident)
-                seen_names.add(name)
+        if has_brace:
+            for match in self.FUNCTION_PATTERN.finditer(source):
+                name = match.group("name")
+                if name in seen_names:
+                    continue
+                # Skip control flow keywords
+                if name in ("if", "while", "for", "switch", "return", "sizeof"):
+                    continue
+                ident = self._find_function(index, name)
+                if ident:
+                    identifiers.append(ident)
+                    seen_names.add(name)
 
         # Find structs/classes
-        for match in self.STRUCT_CLASS_PATTERN.finditer(source):
-            name = match.group("name")
-            if name in seen_names:
-                continue
-            ident = self._find_struct_class(source, lines, name)
-            if ident:
-                identifiers.append(ident)
-                seen_names.add(name)
+        if has_brace:
+            for match in self.STRUCT_CLASS_PATTERN.finditer(source):
+                name = match.group("name")
+                if name in seen_names:
+                    continue
+                ident = self._find_struct_class(index, name)
+                if ident:
+                    identifiers.append(ident)
+                    seen_names.add(name)
 
         # Find typedefs
-        for match in self.TYPEDEF_PATTERN.finditer(source):
-            name = match.group("name")
-            if name in seen_names:
-                continue
-            ident = self._find_typedef(source, lines, name)
-            if ident:
-                identifiers.append(ident)
-                seen_names.add(name)
+        if "typedef" in source:
+            for match in self.TYPEDEF_PATTERN.finditer(source):
+                name = match.group("name")
+                if name in seen_names:
+                    continue
+                ident = self._find_typedef(index, name)
+                if ident:
+                    identifiers.append(ident)
+                    seen_names.add(name)
 
         # Find macros
-        for match in self.DEFINE_PATTERN.finditer(source):
-            name = match.group("name")
-            if name in seen_names:
-                continue
-            ident = self._find_macro(source, lines, name)
-            if ident:
-                identifiers.append(ident)
-                seen_names.add(name)
+        if "define" in source:
+            for match in self.DEFINE_PATTERN.finditer(source):
+                name = match.group("name")
+                if name in seen_names:
+                    continue
+                ident = self._find_macro(index, name)
+                if ident:
+                    identifiers.append(ident)
+                    seen_names.add(name)
 
         return identifiers
 
     def _find_function(
-        self, source: str, lines: list[str], name: str
+        self, index: _LineIndex, name: str
     ) -> Optional[Identifier]:
         """Find a function definition by name."""
         # Build pattern for this specific function
         # The tricky part is handling "char *func" vs "char* func" vs "char * func"
-        pattern = re.compile(
-            rf"""
-            ^[ \t]*
-            (?:(?:__\w+__\s*\([^)]*\)\s*)*)
-            (?:(?:static|inline|extern|virtual|const|unsigned|signed|long|short)\s+)*
-            [\w_][\w_\s\*&:<>,]*?
-            [\s\*&]
-            {re.escape(name)}
-            \s*
-            \([^)]*\)
-            \s*
-            (?:const\s*)?
-            (?:override\s*)?
-            (?:noexcept(?:\([^)]*\))?\s*)?
-            \s*
-            \{{
-            """,
-            re.MULTILINE | re.VERBOSE
-        )
+        source = index.source
+        pattern = _function_pattern(name)
 
         match = pattern.search(source)
         if not match:
             return None
 
         start_pos = match.start()
-        start_line = source[:start_pos].count("\n") + 1
+        start_line = index.line_at(start_pos)
 
         # Find matching closing brace
         brace_pos = match.end() - 1
@@ -261,8 +417,8 @@ class GCCParserBase(Parser):
         if end_pos == -1:
             return None
 
-        end_line = source[:end_pos + 1].count("\n") + 1
-        identifier_source = "\n".join(lines[start_line - 1 : end_line])
+        end_line = index.line_at(end_pos + 1)
+        identifier_source = index.text(start_line, end_line)
 
         return Identifier(
             name=name,
@@ -272,29 +428,20 @@ class GCCParserBase(Parser):
         )
 
     def _find_struct_class(
-        self, source: str, lines: list[str], name: str
+        self, index: _LineIndex, name: str
     ) -> Optional[Identifier]:
         """Find a struct/class/union/enum definition by name."""
-        pattern = re.compile(
-            rf"""
-            ^[ \t]*
-            (?P<keyword>struct|class|union|enum)
-            \s+
-            {re.escape(name)}
-            \s*
-            (?::\s*[^{{]+)?
-            \s*
-            \{{
-            """,
-            re.MULTILINE | re.VERBOSE
-        )
+        source = index.source
+        if not any(keyword in source for keyword in ("struct", "class", "union", "enum")):
+            return None
+        pattern = _struct_class_pattern(name)
 
         match = pattern.search(source)
         if not match:
             return None
 
         start_pos = match.start()
-        start_line = source[:start_pos].count("\n") + 1
+        start_line = index.line_at(start_pos)
 
         # Find matching closing brace
         brace_pos = match.end() - 1
@@ -302,13 +449,15 @@ class GCCParserBase(Parser):
         if end_pos == -1:
             return None
 
-        # Include trailing semicolon if present
-        remaining = source[end_pos + 1 : end_pos + 10].lstrip()
+        # Include trailing semicolon if present; it sits just past the
+        # whitespace lstrip() removed, so no need to search for it
+        tail = source[end_pos + 1 : end_pos + 10]
+        remaining = tail.lstrip()
         if remaining.startswith(";"):
-            end_pos = source.index(";", end_pos) + 1
+            end_pos += 1 + len(tail) - len(remaining) + 1
 
-        end_line = source[:end_pos].count("\n") + 1
-        identifier_source = "\n".join(lines[start_line - 1 : end_line])
+        end_line = index.line_at(end_pos)
+        identifier_source = index.text(start_line, end_line)
 
         return Identifier(
             name=name,
@@ -318,14 +467,14 @@ class GCCParserBase(Parser):
         )
 
     def _find_typedef(
-        self, source: str, lines: list[str], name: str
+        self, index: _LineIndex, name: str
     ) -> Optional[Identifier]:
         """Find a typedef by name."""
         # Simple typedef (no struct)
-        pattern = re.compile(
-            rf"^[ \t]*typedef\s+.+?\s+{re.escape(name)}\s*;",
-            re.MULTILINE
-        )
+        source = index.source
+        if "typedef" not in source:
+            return None
+        pattern = _typedef_pattern(name)
 
         match = pattern.search(source)
         if not match:
@@ -333,10 +482,10 @@ class GCCParserBase(Parser):
 
         start_pos = match.start()
         end_pos = match.end()
-        start_line = source[:start_pos].count("\n") + 1
-        end_line = source[:end_pos].count("\n") + 1
+        start_line = index.line_at(start_pos)
+        end_line = index.line_at(end_pos)
 
-        identifier_source = "\n".join(lines[start_line - 1 : end_line])
+        identifier_source = index.text(start_line, end_line)
 
         return Identifier(
             name=name,
@@ -345,28 +494,63 @@ class GCCParserBase(Parser):
             end_line=end_line,
         )
 
+    @staticmethod
+    def _macro_start(source: str, name: str) -> int:
+        """Offset of the line holding the first "#define name", or -1.
+
+        Matches like ^[ \\t]*#\\s*define\\s+name, but finds each occurrence
+        of the name with str.find and checks what precedes it in place.
+        """
+        pos = source.find(name)
+        while pos >= 0:
+            # Whitespace back to "define", optional whitespace back to '#'
+            end = pos
+            while end > 0 and source[end - 1].isspace():
+                end -= 1
+            if end < pos and source.endswith("define", 0, end):
+                hash_pos = end - 7
+                while hash_pos >= 0 and source[hash_pos].isspace():
+                    hash_pos -= 1
+                if hash_pos >= 0 and source[hash_pos] == "#":
+                    # Only indentation between '#' and the start of its line
+                    line_start = hash_pos
+                    while line_start > 0 and source[line_start - 1] in " \t":
+                        line_start -= 1
+                    if line_start == 0 or source[line_start - 1] == "\n":
+                        return line_start
+            pos = source.find(name, pos + 1)
+        return -1
+
     def _find_macro(
-        self, source: str, lines: list[str], name: str
+        self, index: _LineIndex, name: str
     ) -> Optional[Identifier]:
         """Find a #define macro by name."""
-        pattern = re.compile(
-            rf"^[ \t]*#\s*define\s+{re.escape(name)}(?:\([^)]*\))?",
-            re.MULTILINE
-        )
-
-        match = pattern.search(source)
-        if not match:
+        source = index.source
+        start_pos = self._macro_start(source, name)
+        if start_pos < 0:
             return None
 
-        start_pos = match.start()
-        start_line = source[:start_pos].count("\n") + 1
+        start_line = index.line_at(start_pos)
 
-        # Handle line continuations
+        # Handle line continuations: a line continues when its last
+        # non-whitespace character is a backslash
         end_line = start_line
-        while end_line <= len(lines) and lines[end_line - 1].rstrip().endswith("\\"):
+        line_start = start_pos
+        while True:
+            line_end = source.find("\n", line_start)
+            if line_end == -1:
+                line_end = len(source)
+            last = line_end - 1
+            while last >= line_start and source[last].isspace():
+                last -= 1
+            if last < line_start or source[last] != "\\":
+                break
             end_line += 1
+            if line_end == len(source):
+                break
+            line_start = line_end + 1
 
-        identifier_source = "\n".join(lines[start_line - 1 : end_line])
+        identifier_source = index.text(start_line, end_line)
 
         return Identifier(
             name=name,
@@ -376,25 +560,12 @@ class GCCParserBase(Parser):
         )
 
     def _find_global_var(
-        self, source: str, lines: list[str], name: str
+        self, index: _LineIndex, name: str
     ) -> Optional[Identifier]:
         """Find a global variable by name."""
         # Handle "char *name" vs "char* name" vs "char * name"
-        pattern = re.compile(
-            rf"""
-            ^[ \t]*
-            (?:static\s+|extern\s+|const\s+|volatile\s+)*
-            [\w_][\w_\s\*&]+?
-            [\s\*&]
-            {re.escape(name)}
-            \s*
-            (?:\[[^\]]*\])?
-            \s*
-            (?:=\s*[^;]+)?
-            \s*;
-            """,
-            re.MULTILINE | re.VERBOSE
-        )
+        source = index.source
+        pattern = _global_var_pattern(name)
 
         match = pattern.search(source)
         if not match:
@@ -402,10 +573,10 @@ class GCCParserBase(Parser):
 
         start_pos = match.start()
         end_pos = match.end()
-        start_line = source[:start_pos].count("\n") + 1
-        end_line = source[:end_pos].count("\n") + 1
+        start_line = index.line_at(start_pos)
+        end_line = index.line_at(end_pos)
 
-        identifier_source = "\n".join(lines[start_line - 1 : end_line])
+        identifier_source = index.text(start_line, end_line)
 
         return Identifier(
             name=name,
@@ -415,69 +586,63 @@ class GCCParserBase(Parser):
         )
 
     def _find_matching_brace(self, source: str, open_pos: int) -> int:
-        """Find the position of the matching closing brace."""
+        """Find the position of the matching closing brace.
+
+        Braces inside string and char literals and comments are ignored. The
+        scan jumps between the characters that can change state rather than
+        stepping through the source one character at a time.
+        """
         if open_pos >= len(source) or source[open_pos] != "{":
             return -1
 
         depth = 1
         pos = open_pos + 1
-        in_string = False
-        in_char = False
-        in_block_comment = False
-        in_line_comment = False
-
-        while pos < len(source) and depth > 0:
+        search = _BRACE_SCAN_RE.search
+        while True:
+            match = search(source, pos)
+            if not match:
+                return -1
+            pos = match.start()
             char = source[pos]
-            prev_char = source[pos - 1] if pos > 0 else ""
-            next_char = source[pos + 1] if pos + 1 < len(source) else ""
 
-            # Handle line comments
-            if in_line_comment:
-                if char == "\n":
-                    in_line_comment = False
+            if char == "{":
+                depth += 1
                 pos += 1
-                continue
-
-            # Handle block comments
-            if in_block_comment:
-                if char == "/" and prev_char == "*":
-                    in_block_comment = False
-                pos += 1
-                continue
-
-            # Start of comments
-            if not in_string and not in_char:
-                if char == "/" and next_char == "/":
-                    in_line_comment = True
-                    pos += 2
-                    continue
-                if char == "/" and next_char == "*":
-                    in_block_comment = True
-                    pos += 2
-                    continue
-
-            # Handle strings
-            if char == '"' and prev_char != "\\" and not in_char:
-                in_string = not in_string
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return pos
                 pos += 1
-                continue
-
-            # Handle char literals
-            if char == "'" and prev_char != "\\" and not in_string:
-                in_char = not in_char
+            elif char == "/":
+                next_char = source[pos + 1 : pos + 2]
+                if next_char == "/":
+                    # Line comment: resume after the newline
+                    newline = source.find("\n", pos + 2)
+                    if newline == -1:
+                        return -1
+                    pos = newline + 1
+                elif next_char == "*":
+                    # Block comment: resume after the first "*/" past the "/*"
+                    close = source.find("*/", pos + 1)
+                    if close == -1:
+                        return -1
+                    pos = close + 2
+                else:
+                    pos += 1
+            elif source[pos - 1] == "\\":
+                # Escaped quote outside a literal
                 pos += 1
-                continue
-
-            # Count braces (only outside strings/chars/comments)
-            if not in_string and not in_char:
-                if char == "{":
-                    depth += 1
-                elif char == "}":
-                    depth -= 1
-
-            pos += 1
-
-        return pos - 1 if depth == 0 else -1
+            else:
+                # String or char literal: resume after the closing quote
+                close = pos + 1
+                while True:
+                    close = source.find(char, close)
+                    if close == -1:
+                        return -1
+                    if source[close - 1] != "\\":
+                        break
+                    close += 1
+                pos = close + 1
 
     def expand_identifier_pattern(self, source: str, pattern: str) -> list[Identifier]:
         """Expand an identifier pattern to matching identifiers.
@@ -496,29 +661,33 @@ class GCCParserBase(Parser):
         """
         # Check for C/C++ scope resolution operator
         if "::" in pattern:
-            parts = pattern.split("::", 1)
-            struct_name, member_pattern = parts
+            struct_name = pattern.partition("::")[0]
 
             # Get all members of the struct/class
             all_members = self.list_struct_members(source, struct_name)
 
             # Filter by member pattern (which may include wildcards)
-            if "*" in member_pattern or "?" in member_pattern:
-                full_pattern = f"{struct_name}::{member_pattern}"
-                return [m for m in all_members if fnmatch.fnmatch(m.name, full_pattern)]
-            else:
-                return [m for m in all_members if m.name == pattern]
+            return filter_identifiers(all_members, pattern)
 
         # Fall back to base implementation for top-level identifiers
         return super().expand_identifier_pattern(source, pattern)
 
     def extract_identifier(self, source: str, name: str) -> Optional[Identifier]:
         """Extract a specific identifier from C/C++ source code."""
-        lines = source.split("\n")
+        # Every pattern contains the name literally, so a substring test
+        # rules out most misses before any regex runs
+        if "::" in name:
+            struct_name, _, member_name = name.partition("::")
+            if struct_name not in source or member_name not in source:
+                return None
+        elif name not in source:
+            return None
+
+        index = _LineIndex(source)
 
         # Check for struct/class member notation
         if "::" in name:
-            return self._extract_struct_member(source, lines, name)
+            return self._extract_struct_member(index, name)
 
         # Try each pattern type
         for finder in [
@@ -528,51 +697,44 @@ class GCCParserBase(Parser):
             self._find_macro,
             self._find_global_var,
         ]:
-            identifier = finder(source, lines, name)
+            identifier = finder(index, name)
             if identifier:
                 return identifier
 
         return None
 
     def _extract_struct_member(
-        self, source: str, lines: list[str], qualified_name: str
+        self, index: _LineIndex, qualified_name: str
     ) -> Optional[Identifier]:
         """Extract a struct/class member using :: notation.
 
         Args:
-            source: The full source code.
-            lines: Source code split into lines.
+            index: The full source code with its line index.
             qualified_name: Name in format "StructName::member_name".
 
         Returns:
             An Identifier if found, None otherwise.
         """
-        parts = qualified_name.split("::", 1)
-        if len(parts) != 2:
+        struct_name, sep, member_name = qualified_name.partition("::")
+        if not sep:
             return None
-        struct_name, member_name = parts
 
         # Find the struct/class
-        struct_ident = self._find_struct_class(source, lines, struct_name)
+        struct_ident = self._find_struct_class(index, struct_name)
         if not struct_ident:
             return None
 
-        # Parse members within the struct body
-        struct_source = struct_ident.source
-        struct_lines = struct_source.split("\n")
-
         # Find the member within the struct
-        member = self._find_member_in_struct(struct_source, struct_lines, member_name, qualified_name)
+        member = self._find_member_in_struct(struct_ident.source, member_name, qualified_name)
         return member
 
     def _find_member_in_struct(
-        self, struct_source: str, struct_lines: list[str], member_name: str, qualified_name: str
+        self, struct_source: str, member_name: str, qualified_name: str
     ) -> Optional[Identifier]:
         """Find a specific member within a struct/class body.
 
         Args:
             struct_source: The source code of the struct/class.
-            struct_lines: Source lines of the struct.
             member_name: The member name to find.
             qualified_name: The full qualified name (StructName::member).
 
@@ -589,7 +751,7 @@ class GCCParserBase(Parser):
         body_end = struct_source.rfind("}")
         if body_end == -1:
             body_end = len(struct_source)
-        body = struct_source[body_start:body_end]
+        body = _LineIndex(struct_source[body_start:body_end])
 
         # Try to find member as a function
         func_ident = self._find_member_function(body, member_name, qualified_name)
@@ -604,53 +766,59 @@ class GCCParserBase(Parser):
         return None
 
     def _find_member_function(
-        self, body: str, member_name: str, qualified_name: str
+        self, body: _LineIndex, member_name: str, qualified_name: str
     ) -> Optional[Identifier]:
         """Find a member function within a struct/class body."""
-        for match in self._iter_member_functions(body):
-            if match.group("name") != member_name:
-                continue
+        for match in self._iter_member_functions(body.source):
+            if match.group("name") == member_name:
+                return self._member_function_from_match(body, match, qualified_name)
+        return None
 
-            start_pos = match.start()
-            brace_pos = match.end() - 1
-            end_pos = self._find_matching_brace(body, brace_pos)
-            if end_pos == -1:
-                return None
+    def _member_function_from_match(
+        self, body: _LineIndex, match: re.Match, qualified_name: str
+    ) -> Optional[Identifier]:
+        """Build a member function Identifier from its pattern match."""
+        start_pos = match.start()
+        brace_pos = match.end() - 1
+        end_pos = self._find_matching_brace(body.source, brace_pos)
+        if end_pos == -1:
+            return None
 
-            member_source = body[start_pos:end_pos + 1].strip()
-            start_line = body[:start_pos].count("\n") + 1
-            end_line = body[:end_pos + 1].count("\n") + 1
+        member_source = body.source[start_pos:end_pos + 1].strip()
+        start_line = body.line_at(start_pos)
+        end_line = body.line_at(end_pos + 1)
 
-            return Identifier(
-                name=qualified_name,
-                source=member_source,
-                start_line=start_line,
-                end_line=end_line,
-            )
-        return None
+        return Identifier(
+            name=qualified_name,
+            source=member_source,
+            start_line=start_line,
+            end_line=end_line,
+        )
 
     def _find_member_field(
-        self, body: str, member_name: str, qualified_name: str
+        self, body: _LineIndex, member_name: str, qualified_name: str
     ) -> Optional[Identifier]:
         """Find a member field (variable) within a struct/class body."""
-        for match in self._iter_member_fields(body):
-            if match.group("name") != member_name:
-                continue
-
-            member_source = match.group(0).strip()
-            start_pos = match.start()
-            end_pos = match.end()
-            start_line = body[:start_pos].count("\n") + 1
-            end_line = body[:end_pos].count("\n") + 1
-
-            return Identifier(
-                name=qualified_name,
-                source=member_source,
-                start_line=start_line,
-                end_line=end_line,
-            )
+        for match in self._iter_member_fields(body.source):
+            if match.group("name") == member_name:
+                return self._member_field_from_match(body, match, qualified_name)
         return None
 
+    def _member_field_from_match(
+        self, body: _LineIndex, match: re.Match, qualified_name: str
+    ) -> Identifier:
+        """Build a member field Identifier from its pattern match."""
+        member_source = match.group(0).strip()
+        start_line = body.line_at(match.start())
+        end_line = body.line_at(match.end())
+
+        return Identifier(
+            name=qualified_name,
+            source=member_source,
+            start_line=start_line,
+            end_line=end_line,
+        )
+
     def list_struct_members(self, source: str, struct_name: str) -> list[Identifier]:
         """List all members of a specific struct/class.
 
@@ -662,11 +830,16 @@ class GCCParserBase(Parser):
             A list of all identifiers (methods, fields) in the struct/class.
             Names are qualified with the struct name (e.g., "StructName::field").
         """
-        lines = source.split("\n")
+        return self._cached_list(
+            struct_name, source, lambda: self._list_struct_members(source, struct_name)
+        )
+
+    def _list_struct_members(self, source: str, struct_name: str) -> list[Identifier]:
+        """Scan source for a struct's members; see list_struct_members."""
         identifiers = []
 
         # Find the struct/class
-        struct_ident = self._find_struct_class(source, lines, struct_name)
+        struct_ident = self._find_struct_class(_LineIndex(source), struct_name)
         if not struct_ident:
             return []
 
@@ -682,25 +855,24 @@ class GCCParserBase(Parser):
         body_end = struct_source.rfind("}")
         if body_end == -1:
             body_end = len(struct_source)
-        body = struct_source[body_start:body_end]
+        body = _LineIndex(struct_source[body_start:body_end])
 
-        # Find all member functions
-        for match in self._iter_member_functions(body):
-            name = match.group("name")
-            qualified_name = f"{struct_name}::{name}"
-            member = self._find_member_function(body, name, qualified_name)
+        # Find all member functions. Each name's first match is the one a
+        # lookup by name would find, so build identifiers straight from it.
+        for match in self._iter_member_functions(body.source):
+            qualified_name = f"{struct_name}::{match.group('name')}"
+            member = self._member_function_from_match(body, match, qualified_name)
             if member:
                 identifiers.append(member)
 
         # Find all member fields
-        for match in self._iter_member_fields(body):
-            name = match.group("name")
-            qualified_name = f"{struct_name}::{name}"
+        seen = {i.name for i in identifiers}
+        for match in self._iter_member_fields(body.source):
+            qualified_name = f"{struct_name}::{match.group('name')}"
             # Avoid duplicates (in case pattern matches function names too)
-            if not any(i.name == qualified_name for i in identifiers):
-                member = self._find_member_field(body, name, qualified_name)
-                if member:
-                    identifiers.append(member)
+            if qualified_name not in seen:
+                identifiers.append(self._member_field_from_match(body, match, qualified_name))
+                seen.add(qualified_name)
 
         return identifiers
 
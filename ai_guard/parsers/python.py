@@ -1,10 +1,25 @@
 """Python parser using the ast module."""
 
 import ast
-import fnmatch
+import functools
 from typing import Optional
 
-from ai_guard.parsers.base import Parser, Identifier, register_parser
+from ai_guard.parsers.base import Parser, Identifier, filter_identifiers, register_parser
+
+
+@functools.lru_cache(maxsize=8)
+def _parse(source: str) -> Optional[tuple[ast.Module, list[str]]]:
+    """Parse source into its tree and lines, or None if it doesn't parse.
+
+    Cached by source text (lru_cache is safe to share between verify's
+    worker threads), so commands that expand several identifiers in one
+    file, such as update --all, parse it once. Results are shared between
+    callers, which must not modify them.
+    """
+    try:
+        return ast.parse(source), source.splitlines(keepends=True)
+    except SyntaxError:
+        return None
 
 
 class PythonParser(Parser):
@@ -29,56 +44,95 @@ class PythonParser(Parser):
         Returns:
             An Identifier object if found, None otherwise.
         """
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return None
+        return self.extract_identifiers(source, [name])[name]
 
-        lines = source.splitlines(keepends=True)
+    def extract_identifiers(
+        self, source: str, names: list[str]
+    ) -> dict[str, Optional[Identifier]]:
+        """Extract several identifiers, parsing the source only once.
 
+        Args:
+            source: The full source code of the file.
+            names: Simple or dotted names, as for extract_identifier().
+
+        Returns:
+            Dict mapping each name to its Identifier, or None if not found.
+        """
+        parsed = _parse(source)
+        if parsed is None:
+            return {name: None for name in names}
+
+        tree, lines = parsed
+        class_members = (
+            self._class_member_index(tree) if any("." in name for name in names) else {}
+        )
+        return {
+            name: self._find_identifier(tree, name, lines, class_members) for name in names
+        }
+
+    def _find_identifier(
+        self,
+        tree: ast.Module,
+        name: str,
+        lines: list[str],
+        class_members: dict[str, dict[str, ast.AST]],
+    ) -> Optional[Identifier]:
+        """Find an identifier by simple or dotted name in a parsed module."""
         # Check for dotted name (class member)
         if "." in name:
-            return self._extract_class_member(tree, name, lines)
+            return self._extract_class_member(class_members, name, lines)
 
-        for node in ast.walk(tree):
+        for node in ast.iter_child_nodes(tree):
             identifier = self._node_to_identifier(node, name, lines)
             if identifier:
                 return identifier
 
         return None
 
+    def _class_member_index(self, tree: ast.Module) -> dict[str, dict[str, ast.AST]]:
+        """Map each top-level class name to its members by name.
+
+        Built once per lookup batch so that resolving many dotted names doesn't
+        rescan the module and class bodies for each one. Classes defined more
+        than once under the same name are searched in order, and the first
+        member with a given name wins.
+        """
+        index: dict[str, dict[str, ast.AST]] = {}
+        for node in ast.iter_child_nodes(tree):
+            if isinstance(node, ast.ClassDef):
+                members = index.setdefault(node.name, {})
+                for member in node.body:
+                    member_name = self._get_node_name(member)
+                    if member_name is not None:
+                        members.setdefault(member_name, member)
+        return index
+
     def _extract_class_member(
         self,
-        tree: ast.Module,
+        class_members: dict[str, dict[str, ast.AST]],
         dotted_name: str,
         lines: list[str],
     ) -> Optional[Identifier]:
         """Extract a class member using dotted notation.
 
         Args:
-            tree: The parsed AST.
+            class_members: Index from _class_member_index().
             dotted_name: Name in format "ClassName.member_name".
             lines: Source code split into lines.
 
         Returns:
             An Identifier if found, None otherwise.
         """
-        parts = dotted_name.split(".", 1)
-        if len(parts) != 2:
+        class_name, sep, member_name = dotted_name.partition(".")
+        if not sep:
             return None
-        class_name, member_name = parts
 
-        # Find the class
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                # Search within the class body
-                for member in node.body:
-                    identifier = self._node_to_identifier(
-                        member, member_name, lines, qualified_name=dotted_name
-                    )
-                    if identifier:
-                        return identifier
-        return None
+        member = class_members.get(class_name, {}).get(member_name)
+        if member is None:
+            return None
+        return self._node_to_identifier(
+            member, member_name, lines, qualified_name=dotted_name
+        )
 
     def list_identifiers(self, source: str) -> list[Identifier]:
         """List all top-level identifiers in Python source code.
@@ -89,12 +143,11 @@ class PythonParser(Parser):
         Returns:
             A list of all identifiers found in the source.
         """
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
+        parsed = _parse(source)
+        if parsed is None:
             return []
 
-        lines = source.splitlines(keepends=True)
+        tree, lines = parsed
         identifiers = []
 
         for node in ast.iter_child_nodes(tree):
@@ -125,24 +178,24 @@ class PythonParser(Parser):
             A list of all identifiers (methods, properties, class vars) in the class.
             Names are qualified with the class name (e.g., "ClassName.method").
         """
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
+        parsed = _parse(source)
+        if parsed is None:
             return []
 
-        lines = source.splitlines(keepends=True)
+        tree, lines = parsed
         identifiers = []
 
         for node in ast.iter_child_nodes(tree):
             if isinstance(node, ast.ClassDef) and node.name == class_name:
                 for member in node.body:
-                    qualified_name = f"{class_name}.{self._get_node_name(member)}"
-                    if self._get_node_name(member):
-                        identifier = self._node_to_identifier(
-                            member, None, lines, qualified_name=qualified_name
-                        )
-                        if identifier:
-                            identifiers.append(identifier)
+                    member_name = self._get_node_name(member)
+                    if not member_name:
+                        continue
+                    identifier = self._node_to_identifier(
+                        member, None, lines, qualified_name=f"{class_name}.{member_name}"
+                    )
+                    if identifier:
+                        identifiers.append(identifier)
                 break
 
         return identifiers
@@ -181,18 +234,13 @@ class PythonParser(Parser):
         """
         # Check for Python class member notation (contains a dot)
         if "." in pattern:
-            parts = pattern.split(".", 1)
-            class_name, member_pattern = parts
+            class_name = pattern.partition(".")[0]
 
             # Get all members of the class
             all_members = self.list_class_members(source, class_name)
 
             # Filter by member pattern (which may include wildcards)
-            if "*" in member_pattern or "?" in member_pattern:
-                full_pattern = f"{class_name}.{member_pattern}"
-                return [m for m in all_members if fnmatch.fnmatch(m.name, full_pattern)]
-            else:
-                return [m for m in all_members if m.name == pattern]
+            return filter_identifiers(all_members, pattern)
 
         # Fall back to base implementation for top-level identifiers
         return super().expand_identifier_pattern(source, pattern)
@@ -4,10 +4,9 @@ This parser extracts function, struct, enum, trait, impl, const, static,
 type alias, macro, and module definitions from Rust source files.
 """
 
-import fnmatch
 from typing import Optional
 
-from ai_guard.parsers.base import Parser, Identifier, register_parser
+from ai_guard.parsers.base import Parser, Identifier, filter_identifiers, register_parser
 
 try:
     import tree_sitter_rust as _tsrust
@@ -92,11 +91,18 @@ class RustParser(Parser):
     """
 
     def extract_identifier(self, source: str, name: str) -> Optional[Identifier]:
+        return self.extract_identifiers(source, [name])[name]
+
+    def extract_identifiers(
+        self, source: str, names: list[str]
+    ) -> dict[str, Optional[Identifier]]:
         _ensure_available()
         source_bytes = source.encode("utf-8")
         tree = _make_parser().parse(source_bytes)
         root = tree.root_node
+        return {name: self._find_identifier(root, source_bytes, name) for name in names}
 
+    def _find_identifier(self, root, source_bytes: bytes, name: str) -> Optional[Identifier]:
         # Check for :: member notation
         if "::" in name:
             return self._extract_member(root, source_bytes, name)
@@ -141,16 +147,10 @@ class RustParser(Parser):
             tree = _make_parser().parse(source_bytes)
             root = tree.root_node
 
-            parts = pattern.split("::", 1)
-            type_name, member_pattern = parts
+            type_name = pattern.partition("::")[0]
 
             all_members = self._list_members(root, source_bytes, type_name)
-
-            if "*" in member_pattern or "?" in member_pattern:
-                full_pattern = f"{type_name}::{member_pattern}"
-                return [m for m in all_members if fnmatch.fnmatch(m.name, full_pattern)]
-            else:
-                return [m for m in all_members if m.name == pattern]
+            return filter_identifiers(all_members, pattern)
 
         return super().expand_identifier_pattern(source, pattern)
 
@@ -170,10 +170,9 @@ class RustParser(Parser):
     def _extract_member(
         self, root, source_bytes: bytes, qualified_name: str
     ) -> Optional[Identifier]:
-        parts = qualified_name.split("::", 1)
-        if len(parts) != 2:
+        type_name, sep, member_name = qualified_name.partition("::")
+        if not sep:
             return None
-        type_name, member_name = parts
 
         members = self._list_members(root, source_bytes, type_name)
         for m in members:
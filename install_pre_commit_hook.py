@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Install the ai-guard pre-commit hook."""
 
-import subprocess
 import sys
 
 
 def main():
-    result = subprocess.run([sys.executable, "-m", "ai_guard.cli", "install-hook"])
-    return result.returncode
+    # Run the CLI in this process rather than starting a second interpreter
+    from ai_guard.cli import main as cli_main
+
+    return cli_main(["install-git-hooks"])
 
 
 if __name__ == "__main__":
@@ -6,9 +6,11 @@ These tests document the CLI commands and their behavior.
 import pytest
 from pathlib import Path
 import os
+import shutil
+import subprocess
 
-from ai_guard.cli import main, parse_target
-from ai_guard.core import GuardFile
+from ai_guard.cli import main, parse_target, find_project_root
+from ai_guard.core import GuardFile, compute_file_hash
 
 
 class TestParseTarget:
@@ -75,6 +77,28 @@ class TestParseTarget:
         assert identifier == "MyClass.test_*"
 
 
+class TestFindProjectRoot:
+    """Tests for locating the project root."""
+
+    def test_finds_root_from_subdirectory(self, temp_project, monkeypatch):
+        """The root is found by walking up to the directory containing .git."""
+        subdir = temp_project / "src" / "deep"
+        subdir.mkdir(parents=True)
+        monkeypatch.chdir(subdir)
+
+        assert find_project_root() == temp_project.resolve()
+
+    def test_cache_follows_cwd(self, temp_project, tmp_path_factory, monkeypatch):
+        """A cached root is not reused after changing directory."""
+        other = tmp_path_factory.mktemp("other")
+        (other / ".git").mkdir()
+
+        monkeypatch.chdir(temp_project)
+        assert find_project_root() == temp_project.resolve()
+        monkeypatch.chdir(other)
+        assert find_project_root() == other.resolve()
+
+
 class TestAddCommand:
     """Tests for the 'add' command."""
 
@@ -196,6 +220,81 @@ class TestAddCommand:
         assert "module2.py:helper" in content
 
 
+class TestGlobExpansion:
+    """Tests for glob expansion across multiple targets."""
+
+    def test_shared_glob_expanded_once(self, temp_project, monkeypatch):
+        """Targets sharing a glob pattern only walk the filesystem once."""
+        import ai_guard.cli
+
+        (temp_project / "module1.py").write_text(
+            "def foo():\n    pass\n\ndef bar():\n    pass\n", encoding="utf-8"
+        )
+        (temp_project / "module2.py").write_text(
+            "def foo():\n    return 1\n\ndef bar():\n    return 2\n", encoding="utf-8"
+        )
+
+        calls = []
+        original_glob_relative = ai_guard.cli._glob_relative
+
+        def counting_glob_relative(root, pattern):
+            calls.append(pattern)
+            return original_glob_relative(root, pattern)
+
+        monkeypatch.setattr(ai_guard.cli, "_glob_relative", counting_glob_relative)
+        monkeypatch.chdir(temp_project)
+        result = main(["add", "*.py:foo", "*.py:bar"])
+
+        assert result == 0
+        assert len(calls) == 1
+        content = (temp_project / ".ai-guard").read_text()
+        assert "module1.py:foo" in content
+        assert "module2.py:bar" in content
+
+    def test_new_files_seen_by_next_invocation(self, temp_project, monkeypatch):
+        """Glob results are not reused across separate invocations."""
+        (temp_project / "config.py").write_text("A = 1\n", encoding="utf-8")
+        monkeypatch.chdir(temp_project)
+        assert main(["add", "*.py"]) == 0
+
+        (temp_project / "settings.py").write_text("B = 2\n", encoding="utf-8")
+        assert main(["add", "*.py"]) == 0
+
+        content = (temp_project / ".ai-guard").read_text()
+        assert "settings.py" in content
+
+    def test_recursive_glob_skips_vendor_dirs(self, temp_project, monkeypatch):
+        """'**' does not descend into node_modules or __pycache__."""
+        (temp_project / "src" / "pkg").mkdir(parents=True)
+        (temp_project / "src" / "pkg" / "mod.py").write_text("A = 1\n", encoding="utf-8")
+        (temp_project / "node_modules" / "dep").mkdir(parents=True)
+        (temp_project / "node_modules" / "dep" / "vendored.py").write_text("B = 2\n", encoding="utf-8")
+        (temp_project / "src" / "__pycache__").mkdir()
+        (temp_project / "src" / "__pycache__" / "cached.py").write_text("C = 3\n", encoding="utf-8")
+
+        monkeypatch.chdir(temp_project)
+        result = main(["add", "**/*.py"])
+
+        assert result == 0
+        content = (temp_project / ".ai-guard").read_text()
+        assert "src/pkg/mod.py" in content
+        assert "vendored.py" not in content
+        assert "cached.py" not in content
+
+    def test_glob_matches_files_only(self, temp_project, monkeypatch):
+        """Directories matched by a glob are not protected as files."""
+        (temp_project / "config.py").write_text("A = 1\n", encoding="utf-8")
+        (temp_project / "pkg").mkdir()
+
+        monkeypatch.chdir(temp_project)
+        result = main(["add", "*"])
+
+        assert result == 0
+        content = (temp_project / ".ai-guard").read_text()
+        assert "config.py" in content
+        assert "pkg" not in content
+
+
 class TestVerifyCommand:
     """Tests for the 'verify' command."""
 
@@ -225,6 +324,108 @@ class TestVerifyCommand:
         assert result == 1
 
 
+@pytest.mark.skipif(shutil.which("git") is None, reason="git must be installed")
+class TestVerifyStaged:
+    """Tests for 'verify --staged', which only checks files staged for commit."""
+
+    @pytest.fixture
+    def git_project(self, tmp_path, monkeypatch):
+        """A real git repo with two protected files, committed."""
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init")
+        git("config", "user.email", "test@test.com")
+        git("config", "user.name", "Test")
+        (tmp_path / "staged.py").write_text("A = 1\n", encoding="utf-8")
+        (tmp_path / "unstaged.py").write_text("B = 2\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        main(["add", "staged.py", "unstaged.py"])
+        git("add", "-A")
+        git("commit", "-m", "initial")
+        return tmp_path, git
+
+    def test_only_staged_files_checked(self, git_project, capsys):
+        """Modified protected files that are not staged are ignored."""
+        root, git = git_project
+        (root / "unstaged.py").write_text("B = 3\n", encoding="utf-8")
+
+        assert main(["verify", "--staged"]) == 0
+        assert main(["verify"]) == 1
+
+    def test_staged_change_fails(self, git_project, capsys):
+        """A staged modification to a protected file is reported."""
+        root, git = git_project
+        (root / "staged.py").write_text("A = 99\n", encoding="utf-8")
+        git("add", "staged.py")
+
+        result = main(["verify", "--staged"])
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "staged.py - hash mismatch" in captured.err
+        assert "unstaged.py" not in captured.err
+
+    def test_staged_rename_checks_old_path(self, git_project, capsys):
+        """Moving a protected file away is caught under its old path."""
+        root, git = git_project
+        git("mv", "staged.py", "moved.py")
+
+        result = main(["verify", "--staged"])
+
+        assert result == 1
+        assert "staged.py - file not found" in capsys.readouterr().err
+
+    def test_dot_slash_entry_checked_when_staged(self, git_project, capsys):
+        """An entry added as ./path is matched against git's plain path."""
+        root, git = git_project
+        (root / "extra.py").write_text("C = 1\n", encoding="utf-8")
+        main(["add", "./extra.py"])
+        git("add", "-A")
+        git("commit", "-m", "protect extra")
+
+        (root / "extra.py").write_text("C = 2\n", encoding="utf-8")
+        git("add", "extra.py")
+
+        assert main(["verify", "--staged"]) == 1
+        assert "extra.py - hash mismatch" in capsys.readouterr().err
+
+    def test_stored_dot_slash_entry_checked_when_staged(self, git_project, capsys):
+        """An entry already stored as ./path in .ai-guard is still checked."""
+        root, git = git_project
+        (root / "extra.py").write_text("C = 1\n", encoding="utf-8")
+        guard_path = root / ".ai-guard"
+        file_hash = compute_file_hash(root / "extra.py")
+        guard_path.write_text(
+            guard_path.read_text(encoding="utf-8") + f"./extra.py:{file_hash}\n",
+            encoding="utf-8",
+        )
+        GuardFile(root).save()
+        git("add", "-A")
+        git("commit", "-m", "protect extra")
+        assert main(["verify"]) == 0
+
+        (root / "extra.py").write_text("C = 2\n", encoding="utf-8")
+        git("add", "extra.py")
+
+        assert main(["verify", "--staged"]) == 1
+        assert "./extra.py - hash mismatch" in capsys.readouterr().err
+
+    def test_falls_back_to_all_entries_without_git(self, temp_project, monkeypatch, capsys):
+        """If staged files cannot be listed, every entry is verified."""
+        (temp_project / "config.py").write_text("A = 1\n", encoding="utf-8")
+        monkeypatch.chdir(temp_project)
+        main(["add", "config.py"])
+        (temp_project / "config.py").write_text("A = 2\n", encoding="utf-8")
+
+        result = main(["verify", "--staged"])
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "verifying all entries" in captured.err
+        assert "config.py - hash mismatch" in captured.err
+
+
 class TestUpdateCommand:
     """Tests for the 'update' command."""
 
@@ -3,10 +3,13 @@
 These tests document the behavior of protecting entire files from modification.
 """
 
+import os
+import shutil
+
 import pytest
 from pathlib import Path
 
-from ai_guard.core import GuardFile, compute_file_hash
+from ai_guard.core import GuardFile, ProtectedEntry, compute_file_hash
 
 
 class TestWholeFileProtection:
@@ -232,3 +235,319 @@ class TestSelfProtection:
         # Should detect tampering (hash mismatch) and fake file not found
         paths = [f[0].path for f in failures]
         assert ".ai-guard" in paths
+
+
+class TestEntryLineFormat:
+    """Tests for parsing and formatting lines of the .ai-guard file."""
+
+    @pytest.mark.parametrize("line, path, identifier", [
+        ("src/config.py:0123456789abcdef", "src/config.py", None),
+        ("src/app.py:func:0123456789abcdef", "src/app.py", "func"),
+        ("src/app.py:MyClass.method:0123456789abcdef", "src/app.py", "MyClass.method"),
+        ("src/shape.h:Point::x:0123456789abcdef", "src/shape.h", "Point::x"),
+        ("src/lib.rs:tests::helper:0123456789abcdef", "src/lib.rs", "tests::helper"),
+    ])
+    def test_round_trip(self, line, path, identifier):
+        """Lines parse into path, identifier and hash, and format back unchanged."""
+        entry = ProtectedEntry.from_line(line)
+
+        assert entry.path == path
+        assert entry.identifier == identifier
+        assert entry.hash == "0123456789abcdef"
+        assert entry.to_line() == line
+
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "no-colon-here"])
+    def test_ignored_lines(self, line):
+        """Blank lines, comments and lines without a hash are skipped."""
+        assert ProtectedEntry.from_line(line) is None
+
+    def test_backslashes_normalized(self):
+        """Windows-style separators in paths are normalized to forward slashes."""
+        entry = ProtectedEntry.from_line("src\\config.py:0123456789abcdef")
+        assert entry.path == "src/config.py"
+
+    def test_entries_are_immutable(self):
+        """Entries cannot be changed in place, so their cached line stays valid."""
+        import dataclasses
+
+        entry = ProtectedEntry.from_line("src/config.py:0123456789abcdef")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.hash = "fedcba9876543210"
+        assert entry.line == "src/config.py:0123456789abcdef"
+
+    def test_entries_copy_and_pickle(self):
+        """Slotted entries survive copy and pickle round trips."""
+        import copy
+        import pickle
+
+        entry = ProtectedEntry.from_line("src/app.py:func:0123456789abcdef")
+        assert not hasattr(entry, "__dict__")
+        for clone in (copy.copy(entry), pickle.loads(pickle.dumps(entry))):
+            assert clone == entry
+            assert clone.line == entry.line
+
+
+class TestDuplicateEntries:
+    """Tests for .ai-guard files listing the same target more than once."""
+
+    def test_duplicate_target_loaded_once(self, temp_project):
+        """A target listed twice (e.g., after a union merge) is loaded once."""
+        filepath = temp_project / "config.py"
+        filepath.write_text("SECRET = 42\n", encoding="utf-8")
+        file_hash = compute_file_hash(filepath)
+
+        (temp_project / ".ai-guard").write_text(
+            f"config.py:{file_hash}\nconfig.py:0000000000000000\n", encoding="utf-8"
+        )
+
+        guard = GuardFile(temp_project)
+        assert len(guard.entries) == 1
+        assert guard.entries[0].hash == file_hash
+
+    def test_duplicated_line_detected_as_tampering(self, temp_project):
+        """Duplicating an existing line still changes the self-protection hash."""
+        filepath = temp_project / "config.py"
+        filepath.write_text("SECRET = 42\n", encoding="utf-8")
+
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+
+        ai_guard_path = temp_project / ".ai-guard"
+        content = ai_guard_path.read_text()
+        config_line = next(l for l in content.splitlines() if l.startswith("config.py"))
+        ai_guard_path.write_text(content + config_line + "\n")
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [(".ai-guard", "hash mismatch")]
+
+    def test_entries_is_read_only(self, temp_project):
+        """entries is a snapshot, so appending to it fails instead of being lost."""
+        (temp_project / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+
+        with pytest.raises(AttributeError):
+            guard.entries.append(guard.entries[0])
+
+
+class TestVerifyManyFiles:
+    """Tests for verifying entries spread across many files."""
+
+    def test_failures_reported_in_entry_order(self, temp_project):
+        """Failures come back in .ai-guard order however files are checked."""
+        guard = GuardFile(temp_project)
+        for i in range(10):
+            filepath = temp_project / f"mod{i}.py"
+            filepath.write_text(f"X = {i}\n", encoding="utf-8")
+            guard.add_file(f"mod{i}.py")
+        guard.save()
+
+        for i in (7, 2, 5):
+            (temp_project / f"mod{i}.py").write_text("X = -1\n", encoding="utf-8")
+        (temp_project / "mod9.py").unlink()
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [
+            ("mod2.py", "hash mismatch"),
+            ("mod5.py", "hash mismatch"),
+            ("mod7.py", "hash mismatch"),
+            ("mod9.py", "file not found"),
+        ]
+
+    def test_missing_directory_reports_each_file(self, temp_project):
+        """Files under a deleted directory are each reported as not found."""
+        guard = GuardFile(temp_project)
+        (temp_project / "pkg").mkdir()
+        for name in ("a.py", "b.py"):
+            (temp_project / "pkg" / name).write_text("X = 1\n", encoding="utf-8")
+            guard.add_file(f"pkg/{name}")
+        (temp_project / "top.py").write_text("X = 1\n", encoding="utf-8")
+        guard.add_file("top.py")
+        guard.save()
+
+        for name in ("a.py", "b.py"):
+            (temp_project / "pkg" / name).unlink()
+        (temp_project / "pkg").rmdir()
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [
+            ("pkg/a.py", "file not found"),
+            ("pkg/b.py", "file not found"),
+        ]
+
+    def test_parent_replaced_by_file_reports_not_found(self, temp_project):
+        """A file whose parent directory became a regular file is not found."""
+        (temp_project / "a").mkdir()
+        (temp_project / "a" / "b.py").write_text("B = 1\n", encoding="utf-8")
+        (temp_project / "c.py").write_text("C = 1\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("a/b.py")
+        guard.add_file("c.py")
+        guard.save()
+        assert GuardFile(temp_project).verify() == []
+
+        shutil.rmtree(temp_project / "a")
+        (temp_project / "a").write_text("", encoding="utf-8")
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [("a/b.py", "file not found")]
+
+
+class TestVerifyCache:
+    """Tests for the stat-based verify cache kept in .git."""
+
+    def _protect_old_file(self, temp_project):
+        """Protect config.py and backdate it past the racy window."""
+        filepath = temp_project / "config.py"
+        filepath.write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+        os.utime(filepath, (1_000_000_000, 1_000_000_000))
+        return filepath
+
+    def test_unchanged_file_not_rehashed(self, temp_project, monkeypatch):
+        """A second verify of an untouched file reuses the cached hash."""
+        self._protect_old_file(temp_project)
+        assert GuardFile(temp_project).verify() == []
+
+        import ai_guard.core
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-hashed")
+        monkeypatch.setattr(ai_guard.core, "compute_file_hash", fail)
+
+        assert GuardFile(temp_project).verify() == []
+
+    def test_changed_file_detected(self, temp_project):
+        """A change to a cached file is still detected."""
+        filepath = self._protect_old_file(temp_project)
+        assert GuardFile(temp_project).verify() == []
+
+        filepath.write_text("SECRET = 43\n", encoding="utf-8")
+        os.utime(filepath, (1_000_000_001, 1_000_000_001))
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [("config.py", "hash mismatch")]
+
+    def test_no_cache_rehashes(self, temp_project):
+        """use_cache=False catches a change that left mtime and size alone."""
+        filepath = self._protect_old_file(temp_project)
+        assert GuardFile(temp_project).verify() == []
+
+        filepath.write_text("SECRET = 43\n", encoding="utf-8")
+        os.utime(filepath, (1_000_000_000, 1_000_000_000))
+
+        assert GuardFile(temp_project).verify() == []
+        failures = GuardFile(temp_project).verify(use_cache=False)
+        assert [(e.path, reason) for e, reason in failures] == [("config.py", "hash mismatch")]
+
+    def test_cached_failure_is_confirmed(self, temp_project):
+        """A failure from a stale cached hash is re-checked against the file."""
+        import json
+
+        self._protect_old_file(temp_project)
+        assert GuardFile(temp_project).verify() == []
+
+        cache_path = temp_project / ".git" / "ai-guard-verify-cache.json"
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        data["files"]["config.py"]["file_hash"] = "0" * 16
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert GuardFile(temp_project).verify() == []
+
+    def test_recently_modified_file_not_cached(self, temp_project):
+        """Files modified within the racy window are not cached."""
+        filepath = temp_project / "config.py"
+        filepath.write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+        assert guard.verify() == []
+
+        # Same size, same mtime tick: only a fresh hash can catch this
+        stat = filepath.stat()
+        filepath.write_text("SECRET = 43\n", encoding="utf-8")
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        failures = GuardFile(temp_project).verify()
+        assert [(e.path, reason) for e, reason in failures] == [("config.py", "hash mismatch")]
+
+    def test_no_cache_without_git_dir(self, tmp_path):
+        """Without a .git directory, verify works and writes no cache."""
+        (tmp_path / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(tmp_path)
+        guard.add_file("config.py")
+        guard.save()
+
+        assert guard.verify() == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".ai-guard", "config.py"]
+
+
+class TestAtomicSave:
+    """Tests for writing .ai-guard atomically."""
+
+    def test_failed_save_keeps_previous_file(self, temp_project, monkeypatch):
+        """If the final rename fails, the old .ai-guard is untouched and no temp file remains."""
+        (temp_project / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+        before = (temp_project / ".ai-guard").read_text(encoding="utf-8")
+
+        (temp_project / "other.py").write_text("X = 1\n", encoding="utf-8")
+        guard.add_file("other.py")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            guard.save()
+
+        assert (temp_project / ".ai-guard").read_text(encoding="utf-8") == before
+        assert not list(temp_project.glob(".ai-guard.*"))
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_save_keeps_file_mode(self, temp_project):
+        """Rewriting .ai-guard preserves its permissions."""
+        (temp_project / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+        os.chmod(temp_project / ".ai-guard", 0o644)
+
+        guard.remove("config.py")
+        guard.save()
+        assert (temp_project / ".ai-guard").stat().st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_new_file_uses_umask_default(self, temp_project):
+        """A newly created .ai-guard gets the umask's default permissions."""
+        (temp_project / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        umask = os.umask(0o027)
+        try:
+            guard = GuardFile(temp_project)
+            guard.add_file("config.py")
+            guard.save()
+        finally:
+            os.umask(umask)
+
+        assert (temp_project / ".ai-guard").stat().st_mode & 0o777 == 0o640
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_save_writes_through_symlink(self, temp_project):
+        """A symlinked .ai-guard stays a symlink and its target is updated."""
+        (temp_project / "config.py").write_text("SECRET = 42\n", encoding="utf-8")
+        (temp_project / "shared").mkdir()
+        real = temp_project / "shared" / "guard"
+        real.write_text("", encoding="utf-8")
+        (temp_project / ".ai-guard").symlink_to(real)
+
+        guard = GuardFile(temp_project)
+        guard.add_file("config.py")
+        guard.save()
+
+        assert (temp_project / ".ai-guard").is_symlink()
+        assert "config.py" in real.read_text(encoding="utf-8")
+        assert not list((temp_project / "shared").glob("guard.*"))
@@ -709,3 +709,174 @@ struct Point {
         assert len(member_failures) == 1
         assert member_failures[0][0].identifier == "Point::x"
         assert member_failures[0][1] == "hash mismatch"
+
+
+class TestGPPParserMemberConsistency:
+    """Listed members must match what a lookup by name extracts."""
+
+    def test_listed_members_match_extracted(self):
+        """Every listed member equals extract_identifier() for its name."""
+        parser = GPPParser()
+        source = '''
+class Shape {
+public:
+    int width;
+    int height = 0;
+    int area() const {
+        return width * height;
+    }
+    void resize(int w, int h) {
+        if (w > 0) { width = w; }
+        height = h;
+    }
+    static int count;
+};
+'''
+        members = parser.list_struct_members(source, "Shape")
+        assert {"Shape::area", "Shape::resize", "Shape::width"} <= {m.name for m in members}
+        for member in members:
+            extracted = parser.extract_identifier(source, member.name)
+            assert extracted is not None
+            assert (extracted.source, extracted.start_line, extracted.end_line) == (
+                member.source, member.start_line, member.end_line,
+            )
+
+
+class TestGCCParserSyntaxCache:
+    """Tests for caching syntax check results."""
+
+    @pytest.mark.skipif(not GCC_AVAILABLE, reason="GCC not installed")
+    def test_unchanged_source_not_recompiled(self, monkeypatch):
+        """Checking the same source twice runs the compiler once."""
+        import ai_guard.parsers.gcc as gcc_module
+
+        source = "int cached_check(void) { return 1; }\n"
+        parser = GCCParser()
+        assert parser.check_syntax(source) is True
+
+        def fail(*args, **kwargs):
+            raise AssertionError("compiler was run again")
+
+        monkeypatch.setattr(gcc_module.subprocess, "run", fail)
+        assert parser.check_syntax(source) is True
+
+    def test_missing_compiler_not_cached(self, monkeypatch):
+        """A compiler that can't be run fails the check without being remembered."""
+        import ai_guard.parsers.gcc as gcc_module
+
+        source = "int missing_compiler(void) { return 1; }\n"
+
+        class NoCompilerParser(GCCParser):
+            COMPILER = "ai-guard-no-such-compiler"
+
+        assert NoCompilerParser().check_syntax(source) is False
+        assert not any(key[0] == "ai-guard-no-such-compiler" for key in gcc_module._SYNTAX_CACHE)
+
+
+class TestGCCParserMacroContinuations:
+    """Tests for following #define line continuations."""
+
+    def test_whitespace_after_backslash_continues(self):
+        """Trailing blanks after the backslash still continue the macro."""
+        source = "#define SWAP(a, b) \\  \n    do { int t = a; a = b; b = t; } while (0)\nint after;\n"
+        parser = GCCParser()
+        ident = parser.extract_identifier(source, "SWAP")
+
+        assert ident is not None
+        assert (ident.start_line, ident.end_line) == (1, 2)
+        assert "while (0)" in ident.source
+        assert "after" not in ident.source
+
+    def test_continuation_at_end_of_file(self):
+        """A backslash on the last line doesn't run past the end of the source."""
+        source = "#define LAST 1 \\"
+        parser = GCCParser()
+        ident = parser.extract_identifier(source, "LAST")
+
+        assert ident is not None
+        assert ident.source == source
+
+
+class TestGCCParserMacroLookup:
+    """Tests for locating a macro's #define line."""
+
+    def test_indented_define_with_space_after_hash(self):
+        """An indented "# define" is found and starts at its line."""
+        source = "#ifdef DEBUG\n  #  define TRACE(x) log(x)\n#endif\n"
+        parser = GCCParser()
+        ident = parser.extract_identifier(source, "TRACE")
+
+        assert ident is not None
+        assert ident.start_line == 2
+        assert ident.source == "  #  define TRACE(x) log(x)"
+
+    def test_commented_out_define_is_skipped(self):
+        """A #define that doesn't start its line is not the macro's definition."""
+        source = "// #define LIMIT 1\n#define LIMIT 2\n"
+        parser = GCCParser()
+        ident = parser.extract_identifier(source, "LIMIT")
+
+        assert ident is not None
+        assert ident.source == "#define LIMIT 2"
+
+
+class TestGCCParserModifiers:
+    """Tests for definitions led by storage and type modifiers."""
+
+    def test_modifier_run_before_function(self):
+        """Modifiers are matched as part of the return type."""
+        source = '''
+static inline unsigned long hash_key(const char *key) {
+    return 0;
+}
+'''
+        parser = GCCParser()
+        ident = parser.extract_identifier(source, "hash_key")
+
+        assert ident is not None
+        assert ident.source.startswith("static inline unsigned long hash_key")
+
+    def test_long_declaration_without_match(self):
+        """A long run of words that never reaches a definition returns None."""
+        source = " ".join(["static"] * 5000) + " value\n"
+        parser = GCCParser()
+
+        assert parser.extract_identifier(source, "value") is None
+
+
+class TestGCCParserListCache:
+    """Tests for reusing identifier listings of unchanged source."""
+
+    def test_same_source_listed_once(self, monkeypatch):
+        """Listing the same source again reuses the first scan."""
+        source = "int cached_list_a(void) { return 1; }\nint cached_list_b(void) { return 2; }\n"
+        parser = GCCParser()
+        first = parser.list_identifiers(source)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source was scanned again")
+
+        monkeypatch.setattr(parser, "_list_identifiers", fail)
+        assert parser.list_identifiers(source) == first
+        assert [i.name for i in parser.expand_identifier_pattern(source, "cached_list_*")] == [
+            "cached_list_a", "cached_list_b"
+        ]
+
+    def test_returned_list_is_a_copy(self):
+        """Changing a returned list doesn't change later results."""
+        source = "struct CachedPoint {\n    int x;\n    int y;\n};\n"
+        parser = GCCParser()
+        members = parser.list_struct_members(source, "CachedPoint")
+        members.clear()
+
+        assert [m.name for m in parser.list_struct_members(source, "CachedPoint")] == [
+            "CachedPoint::x", "CachedPoint::y"
+        ]
+
+    def test_returned_identifiers_are_copies(self):
+        """Changing a returned identifier doesn't change later results."""
+        source = "int cached_copy(void) { return 1; }\n"
+        parser = GCCParser()
+        parser.list_identifiers(source)[0].name = "changed"
+
+        assert [i.name for i in parser.list_identifiers(source)] == ["cached_copy"]
@@ -53,6 +53,29 @@ class TestLineEndingNormalization:
 
         assert hash_clean == hash_with_cr
 
+    def test_file_hash_matches_text_mode_newlines(self, temp_project):
+        """File hashes treat CRLF and lone CR like text-mode reading does.
+
+        Whole-file hashes are computed from raw bytes, so they must agree
+        with hashing the file's text-mode (universal newline) contents.
+        """
+        filepath = temp_project / "test.py"
+        filepath.write_bytes(b"line1\r\nline2\rline3\n")
+
+        expected = compute_hash(filepath.read_text(encoding="utf-8"))
+        assert compute_file_hash(filepath) == expected
+        assert compute_file_hash(filepath) == compute_hash("line1\nline2\nline3\n")
+
+    def test_file_hash_crlf_across_read_boundary(self, temp_project, monkeypatch):
+        """A CRLF split across two streamed reads is normalized as one newline."""
+        import ai_guard.core
+
+        monkeypatch.setattr(ai_guard.core, "_HASH_CHUNK_SIZE", 4)
+        filepath = temp_project / "test.py"
+        filepath.write_bytes(b"abc\r\ndef\r")
+
+        assert compute_file_hash(filepath) == compute_hash("abc\ndef\n")
+
 
 class TestFileHashing:
     """Tests for whole-file hash computation."""
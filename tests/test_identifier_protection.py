@@ -296,3 +296,92 @@ class TestClassMemberProtection:
         new_hash = guard2.entries[0].hash
 
         assert original_hash != new_hash
+
+    def test_verify_reads_each_file_once(self, temp_project, sample_python_file, monkeypatch):
+        """Verifying many identifiers from one file reads that file once."""
+        guard = GuardFile(temp_project)
+        guard.add_identifier("sample.py", "DecoratedClass.*")
+        guard.add_identifier("sample.py", "test_invariant_*")
+        guard.save()
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        assert guard.verify() == []
+        assert reads.count("sample.py") == 1
+
+    def test_verify_parses_each_file_once(self, temp_project, sample_python_file, monkeypatch):
+        """Verifying many identifiers from one file parses that file once."""
+        import ast
+
+        import ai_guard.parsers.python as python_parser
+
+        guard = GuardFile(temp_project)
+        guard.add_identifier("sample.py", "DecoratedClass.*")
+        guard.add_identifier("sample.py", "test_invariant_*")
+        guard.save()
+
+        # Start from a cold parse cache so verify's own parse is counted
+        python_parser._parse.cache_clear()
+        parses = []
+        original_parse = ast.parse
+
+        def counting_parse(*args, **kwargs):
+            parses.append(args)
+            return original_parse(*args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        assert guard.verify() == []
+        assert len(parses) == 1
+
+    def test_verify_opens_file_once_for_both_entry_kinds(
+        self, temp_project, sample_python_file, monkeypatch
+    ):
+        """A file protected whole and by identifier is opened once per verify."""
+        import builtins
+
+        import ai_guard.core
+
+        guard = GuardFile(temp_project)
+        guard.add_file("sample.py")
+        guard.add_identifier("sample.py", "DecoratedClass.*")
+        guard.save()
+
+        opens = []
+        original_open = builtins.open
+        original_read_text = Path.read_text
+
+        def counting_open(file, *args, **kwargs):
+            opens.append(Path(file).name)
+            return original_open(file, *args, **kwargs)
+
+        def counting_read_text(self, *args, **kwargs):
+            opens.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(ai_guard.core, "open", counting_open, raising=False)
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        assert guard.verify() == []
+        assert opens.count("sample.py") == 1
+
+    def test_update_reads_file_once(self, temp_project, sample_python_file, monkeypatch):
+        """Updating a wildcard reads and expands the file once."""
+        guard = GuardFile(temp_project)
+        guard.add_identifier("sample.py", "DecoratedClass.*")
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        updated = guard.update("sample.py", "DecoratedClass.*")
+        assert updated
+        assert reads.count("sample.py") == 1
@@ -131,3 +131,26 @@ class TestPreCommitHookIntegration:
 
         # Should pass
         assert result.returncode == 0
+
+
+class TestVerifyFreshProcess:
+    """Verify run in a fresh interpreter, where no parser is imported yet."""
+
+    def test_identifiers_in_many_files(self, temp_project, monkeypatch):
+        """Identifier entries across many files verify cleanly."""
+        monkeypatch.chdir(temp_project)
+        for i in range(20):
+            (temp_project / f"mod{i}.py").write_text(
+                f"def func():\n    return {i}\n", encoding="utf-8"
+            )
+        main(["add", "*.py:func"])
+
+        result = subprocess.run(
+            [sys.executable, "-m", "ai_guard.cli", "verify"],
+            capture_output=True,
+            text=True,
+            env=_get_subprocess_env(),
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "verified successfully" in result.stdout
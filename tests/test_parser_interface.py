@@ -11,6 +11,7 @@ from typing import Optional
 from ai_guard.parsers.base import (
     Parser,
     Identifier,
+    filter_identifiers,
     register_parser,
     get_parser_for_file,
 )
@@ -256,3 +257,146 @@ class TestAddingNewLanguageSupport:
         assert parser.extract_identifier(source, "foo") is not None
         assert parser.extract_identifier(source, "baz") is None
         assert len(parser.list_identifiers(source)) == 2
+
+
+class TestFilterIdentifiers:
+    """Tests for the shared identifier pattern matcher used by all parsers."""
+
+    def _idents(self, *names):
+        return [Identifier(name=n, source=n, start_line=1, end_line=1) for n in names]
+
+    def test_exact_name(self):
+        """A pattern without wildcards matches the name exactly."""
+        idents = self._idents("test_a", "test_ab", "other")
+        assert [i.name for i in filter_identifiers(idents, "test_a")] == ["test_a"]
+
+    def test_wildcards(self):
+        """* and ? patterns match like shell wildcards, preserving order."""
+        idents = self._idents("test_b", "other", "test_a", "test_ab")
+        assert [i.name for i in filter_identifiers(idents, "test_*")] == ["test_b", "test_a", "test_ab"]
+        assert [i.name for i in filter_identifiers(idents, "test_?")] == ["test_b", "test_a"]
+
+    def test_wildcard_is_case_sensitive(self):
+        """Identifier names are matched case-sensitively on every platform."""
+        idents = self._idents("Test_a", "test_a")
+        assert [i.name for i in filter_identifiers(idents, "test_*")] == ["test_a"]
+
+    def test_qualified_member_names(self):
+        """Member patterns match the full qualified name."""
+        idents = self._idents("Cls.get_x", "Cls.set_x", "Point::x", "Point::y")
+        assert [i.name for i in filter_identifiers(idents, "Cls.get_*")] == ["Cls.get_x"]
+        assert [i.name for i in filter_identifiers(idents, "Point::*")] == ["Point::x", "Point::y"]
+
+
+class TestParserInstances:
+    """Tests for the shared parser instances handed out by the registry."""
+
+    def test_parser_instance_is_shared(self):
+        """Files with the same parser get the same instance."""
+        assert get_parser_for_file("a.py") is get_parser_for_file("pkg/b.pyw")
+
+    def test_extension_is_case_insensitive(self):
+        """Extensions are matched without regard to case."""
+        assert isinstance(get_parser_for_file("SCRIPT.PY"), PythonParser)
+
+
+class TestPythonParseCache:
+    """Tests for reusing the parse of unchanged Python source."""
+
+    def test_same_source_parsed_once(self, monkeypatch):
+        """Expanding several names in the same source parses it once."""
+        import ast
+
+        import ai_guard.parsers.python as python_parser
+
+        python_parser._parse.cache_clear()
+        parses = []
+        original_parse = ast.parse
+
+        def counting_parse(*args, **kwargs):
+            parses.append(args)
+            return original_parse(*args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        source = "class Cls:\n    def a(self):\n        pass\n\ndef f():\n    pass\n"
+        parser = PythonParser()
+        assert [i.name for i in parser.expand_identifier_pattern(source, "Cls.*")] == ["Cls.a"]
+        assert [i.name for i in parser.expand_identifier_pattern(source, "f")] == ["f"]
+        assert parser.extract_identifier(source, "f") is not None
+        assert len(parses) == 1
+
+        # Changed source is parsed afresh
+        assert parser.extract_identifier(source + "\ndef g():\n    pass\n", "g") is not None
+        assert len(parses) == 2
+
+    def test_syntax_error_still_returns_nothing(self):
+        """A source that doesn't parse yields nothing, from the cache too."""
+        parser = PythonParser()
+        source = "def broken(:\n"
+        for _ in range(2):
+            assert parser.list_identifiers(source) == []
+            assert parser.extract_identifier(source, "broken") is None
+
+
+class TestPythonTopLevelLookup:
+    """Tests for resolving simple names against module-level definitions."""
+
+    def test_simple_name_matches_top_level_definition(self):
+        """A simple name resolves to the module-level definition, as listed."""
+        source = (
+            "class Cls:\n"
+            "    def run(self):\n"
+            "        pass\n"
+            "\n"
+            "def run():\n"
+            "    return 1\n"
+        )
+        parser = PythonParser()
+        ident = parser.extract_identifier(source, "run")
+
+        assert ident is not None
+        assert ident.start_line == 5
+        assert ident in parser.list_identifiers(source)
+
+    def test_nested_definition_needs_qualified_name(self):
+        """Definitions nested in a class or function aren't found by simple name."""
+        source = (
+            "class Cls:\n"
+            "    def method(self):\n"
+            "        pass\n"
+            "\n"
+            "def outer():\n"
+            "    def inner():\n"
+            "        pass\n"
+        )
+        parser = PythonParser()
+
+        assert parser.extract_identifier(source, "method") is None
+        assert parser.extract_identifier(source, "inner") is None
+        assert parser.extract_identifier(source, "Cls.method") is not None
+
+
+class TestPythonClassMemberLookup:
+    """Tests for resolving several dotted names in one pass."""
+
+    def test_batch_lookup_matches_single_lookups(self):
+        """Each dotted name resolves as it would on its own."""
+        source = (
+            "class A:\n"
+            "    x = 1\n"
+            "    def run(self):\n"
+            "        pass\n"
+            "\n"
+            "class A:\n"
+            "    x = 2\n"
+            "    y = 3\n"
+        )
+        parser = PythonParser()
+        names = ["A.x", "A.run", "A.y", "A.missing", "B.x"]
+        batch = parser.extract_identifiers(source, names)
+
+        assert batch == {name: parser.extract_identifier(source, name) for name in names}
+        # The first class defining a member wins; later ones fill in the rest
+        assert batch["A.x"].source == "    x = 1"
+        assert batch["A.y"].source == "    y = 3"
+        assert batch["A.missing"] is None and batch["B.x"] is None